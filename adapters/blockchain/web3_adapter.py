@@ -1,18 +1,22 @@
+import asyncio
 import json
 import time
-from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from decimal import Decimal
 from datetime import datetime
 from web3 import Web3
-from web3.exceptions import ContractLogicError, TimeExhausted
+from web3.exceptions import ContractLogicError, TimeExhausted, Web3TypeError
 from eth_account.messages import encode_defunct
 from eth_typing import Address
 from eth_utils import to_checksum_address
+from eth_utils.abi import get_abi_output_types
 from web3.contract import Contract
 from pathlib import Path
 
 from domain.ports.blockchain_port import BlockchainPort
-from domain.entities.session import Session
+from domain.entities.session import Session, SessionStatus
 from domain.entities.station import Station
 from domain.entities.user import User
 from domain.exceptions.custom_exceptions import (
@@ -29,6 +33,64 @@ from shared.constants.config import Config
 from shared.utils.logger import Logger
 from shared.constants.texts import Texts
 
+# Eventos decodificados a partir dos recibos das transações de escrita
+_RECEIPT_EVENTS = (
+    "SessionStarted",
+    "SessionEnded",
+    "ReservationCreated",
+    "ReservationCancelled",
+    "PaymentProcessed"
+)
+
+
+# Trecho do ABI do Multicall3 usado para agregar leituras em uma única eth_call
+_MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ]
+            }
+        ]
+    }
+]
+
+
+def _load_contract_data(build_path: Path) -> Dict[str, Any]:
+    """
+    Lê o artefato do contrato, relendo o arquivo só quando ele muda no disco
+    (ex.: depois de um novo deploy pelos scripts de deploy).
+    """
+    return _read_contract_data(str(build_path), build_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _read_contract_data(build_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Lê e decodifica o artefato do contrato; o mtime faz parte da chave do cache.
+    """
+    with open(build_path) as f:
+        return json.load(f)
+
+
 class Web3Adapter(BlockchainPort):
     """
     Adaptador Web3 que implementa a interface BlockchainPort.
@@ -42,6 +104,9 @@ class Web3Adapter(BlockchainPort):
         """
         self.logger = Logger(__name__)
         
+        # Cache LRU de leituras do contrato, por bloco (ver _cached_call)
+        self._read_cache: "OrderedDict[Tuple[str, Any, int], Any]" = OrderedDict()
+        
         try:
             # Inicializa conexão Web3
             if Config.WEB3_PROVIDER == "ganache":
@@ -72,8 +137,7 @@ class Web3Adapter(BlockchainPort):
             if not build_path.exists():
                 build_path = Path("contracts/EVCharging.json")
             
-            with open(build_path) as f:
-                contract_data = json.load(f)
+            contract_data = _load_contract_data(build_path)
             
             self.contract_address = Config.WEB3_CONTRACT_ADDRESS or contract_data.get("address")
             if not self.contract_address:
@@ -84,6 +148,22 @@ class Web3Adapter(BlockchainPort):
                 abi=contract_data["abi"]
             )
             
+            # Instancia os eventos uma vez; process_receipt reutiliza os decodificadores
+            abi_events = {item.get("name") for item in contract_data["abi"] if item.get("type") == "event"}
+            self._events = {
+                name: getattr(self.contract.events, name)()
+                for name in _RECEIPT_EVENTS
+                if name in abi_events
+            }
+            
+            # Agregador Multicall3 opcional para leituras em lote
+            self.multicall: Optional[Contract] = None
+            if Config.WEB3_MULTICALL_ADDRESS:
+                self.multicall = self.w3.eth.contract(
+                    address=self.w3.to_checksum_address(Config.WEB3_MULTICALL_ADDRESS),
+                    abi=_MULTICALL3_ABI
+                )
+            
         except Exception as e:
             self.logger.error(Texts.format(Texts.ERROR_BLOCKCHAIN_CONTRACT_LOAD, str(e)))
             raise BlockchainInvalidContractError(Texts.format(Texts.ERROR_BLOCKCHAIN_CONTRACT_LOAD, str(e)))
@@ -93,17 +173,7 @@ class Web3Adapter(BlockchainPort):
         Obtém os detalhes de uma sessão diretamente da blockchain.
         """
         try:
-            session = self.contract.functions.getSession(session_id).call()
-            return {
-                "id": session[0],
-                "station_id": session[1],
-                "user_address": session[2],
-                "start_time": datetime.fromtimestamp(session[3]),
-                "end_time": datetime.fromtimestamp(session[4]) if session[4] > 0 else None,
-                "status": session[5],
-                "amount": Decimal(session[6]) / Decimal(10**18),  # Converter de Wei para ETH
-                "paid": session[7]
-            }
+            return self._format_session(session_id, self.contract.functions.getSession(session_id).call())
         except Exception as e:
             self.logger.error(Texts.format(Texts.ERROR_BLOCKCHAIN_SESSION_GET, str(e)))
             raise BlockchainError(Texts.format(Texts.ERROR_BLOCKCHAIN_SESSION_GET, str(e)))
@@ -113,58 +183,113 @@ class Web3Adapter(BlockchainPort):
         Obtém os detalhes de uma estação diretamente da blockchain.
         """
         try:
-            station = self.contract.functions.getStation(station_id).call()
-            return {
-                "id": station[0],
-                "location": station[1],
-                "status": station[2],
-                "current_session": station[3],
-                "reserved_until": datetime.fromtimestamp(station[4]) if station[4] > 0 else None,
-                "reserved_by": station[5] if station[5] != "0x0000000000000000000000000000000000000000" else None
-            }
+            return self._format_station(self.contract.functions.getStation(station_id).call())
         except Exception as e:
             self.logger.error(Texts.format(Texts.ERROR_BLOCKCHAIN_STATION_GET, str(e)))
             raise BlockchainError(Texts.format(Texts.ERROR_BLOCKCHAIN_STATION_GET, str(e)))
 
-    def get_user_sessions(self, user_address: str) -> List[Dict[str, Any]]:
+    def batch_get(self, calls: List[Tuple[str, tuple]], allow_failure: bool = False) -> List[Optional[Dict[str, Any]]]:
         """
-        Obtém todas as sessões de um usuário diretamente da blockchain.
+        Executa várias leituras do contrato em requisições JSON-RPC em lote,
+        de até Config.WEB3_BATCH_SIZE leituras cada.
+        Com o Multicall3 configurado, cada lote vira uma única eth_call.
+        
+        Args:
+            calls: Lista de pares (método, argumentos), onde método é
+                "get_session" ou "get_station"
+            allow_failure: Se True, leituras revertidas pelo contrato (ex.: ID
+                inexistente) retornam None em vez de falhar o lote inteiro
+            
+        Returns:
+            List[Optional[Dict[str, Any]]]: Resultados formatados, na mesma ordem das chamadas
+            
+        Raises:
+            BlockchainError: Se houver erro em alguma das leituras
+        """
+        # Cada formatador recebe os argumentos da chamada seguidos do retorno bruto
+        readers = {
+            "get_session": (self.contract.functions.getSession, self._format_session),
+            "get_station": (self.contract.functions.getStation, lambda station_id, station: self._format_station(station))
+        }
+        if not calls:
+            return []
+        try:
+            functions = [readers[method][0](*args) for method, args in calls]
+            results = []
+            for start in range(0, len(functions), Config.WEB3_BATCH_SIZE):
+                chunk = functions[start:start + Config.WEB3_BATCH_SIZE]
+                if self.multicall is not None:
+                    results.extend(self._multicall(chunk, allow_failure))
+                    continue
+                try:
+                    results.extend(self._batch_call([function.call for function in chunk]))
+                except ContractLogicError:
+                    if not allow_failure:
+                        raise
+                    # Um lote JSON-RPC falha inteiro; relê as chamadas uma a uma
+                    results.extend(self._call_or_none(function) for function in chunk)
+            return [
+                readers[method][1](*args, raw) if raw is not None else None
+                for (method, args), raw in zip(calls, results)
+            ]
+        except Exception as e:
+            self.logger.error(Texts.format(Texts.ERROR_WEB3_CALL, str(e)))
+            raise BlockchainError(Texts.format(Texts.ERROR_WEB3_CALL, str(e)))
+
+    async def get_sessions_batch(self, session_ids: List[int]) -> List[Session]:
+        """
+        Obtém várias sessões com leituras em lote (ver batch_get).
+        Sessões inexistentes são omitidas do resultado. As leituras bloqueantes
+        rodam no executor padrão para não travar o laço de eventos.
+        """
+        sessions = await asyncio.get_running_loop().run_in_executor(None, partial(
+            self.batch_get,
+            [("get_session", (session_id,)) for session_id in session_ids],
+            allow_failure=True
+        ))
+        return [self._session_entity(session) for session in sessions if session is not None]
+
+    async def get_user_sessions(self, user_address: str, status: Optional[str] = None) -> List[Session]:
+        """
+        Obtém as sessões de um usuário diretamente da blockchain, opcionalmente
+        filtradas por status.
         """
         try:
             # Obtém IDs das sessões do usuário
-            session_ids = self.contract.functions.getUserSessions(
-                self.w3.to_checksum_address(user_address)
-            ).call()
-            
-            # Obtém detalhes de cada sessão
-            sessions = []
-            for session_id in session_ids:
-                sessions.append(self.get_session(session_id))
+            session_ids = await asyncio.get_running_loop().run_in_executor(
+                None,
+                self.contract.functions.getUserSessions(self.w3.to_checksum_address(user_address)).call
+            )
             
-            return sessions
+            # Obtém os detalhes de todas as sessões em uma única requisição
+            sessions = await self.get_sessions_batch(session_ids)
             
         except Exception as e:
             self.logger.error(Texts.format(Texts.ERROR_BLOCKCHAIN_USER_SESSIONS, str(e)))
             raise BlockchainError(Texts.format(Texts.ERROR_BLOCKCHAIN_USER_SESSIONS, str(e)))
+        
+        return [session for session in sessions if status is None or session.status.value == status]
 
-    def get_station_sessions(self, station_id: int) -> List[Dict[str, Any]]:
+    async def get_station_sessions(self, station_id: int, status: Optional[str] = None) -> List[Session]:
         """
-        Obtém todas as sessões de uma estação diretamente da blockchain.
+        Obtém as sessões de uma estação diretamente da blockchain, opcionalmente
+        filtradas por status.
         """
         try:
             # Obtém IDs das sessões da estação
-            session_ids = self.contract.functions.getStationSessions(station_id).call()
-            
-            # Obtém detalhes de cada sessão
-            sessions = []
-            for session_id in session_ids:
-                sessions.append(self.get_session(session_id))
+            session_ids = await asyncio.get_running_loop().run_in_executor(
+                None,
+                self.contract.functions.getStationSessions(station_id).call
+            )
             
-            return sessions
+            # Obtém os detalhes de todas as sessões em uma única requisição
+            sessions = await self.get_sessions_batch(session_ids)
             
         except Exception as e:
             self.logger.error(Texts.format(Texts.ERROR_BLOCKCHAIN_STATION_SESSIONS, str(e)))
             raise BlockchainError(Texts.format(Texts.ERROR_BLOCKCHAIN_STATION_SESSIONS, str(e)))
+        
+        return [session for session in sessions if status is None or session.status.value == status]
 
     def start_session(self, station_id: int, user_address: str) -> Dict[str, Any]:
         """
@@ -172,26 +297,22 @@ class Web3Adapter(BlockchainPort):
         """
         try:
             # Prepara transação
-            tx = self.contract.functions.startSession(
-                station_id,
-                self.w3.to_checksum_address(user_address)
-            ).build_transaction({
-                "from": self.w3.to_checksum_address(user_address),
-                "gas": Config.WEB3_GAS_LIMIT,
-                "nonce": self.w3.eth.get_transaction_count(user_address)
-            })
+            tx = self._build_transaction(
+                self.contract.functions.startSession(
+                    station_id,
+                    self.w3.to_checksum_address(user_address)
+                ),
+                user_address
+            )
             
             # Envia transação
-            tx_hash = self.w3.eth.send_transaction(tx)
+            tx_hash = self._submit_transaction(tx)
             
             # Aguarda confirmação
-            receipt = self.w3.eth.wait_for_transaction_receipt(
-                tx_hash,
-                timeout=Config.WEB3_TIMEOUT
-            )
+            receipt = self._confirm_transaction(tx_hash)
             
             # Obtém evento de sessão iniciada
-            session_started = self.contract.events.SessionStarted().process_receipt(receipt)[0]
+            session_started = self._events["SessionStarted"].process_receipt(receipt)[0]
             session_id = session_started["args"]["sessionId"]
             
             # Retorna detalhes da sessão
@@ -207,23 +328,19 @@ class Web3Adapter(BlockchainPort):
         """
         try:
             # Prepara transação
-            tx = self.contract.functions.endSession(session_id).build_transaction({
-                "from": self.w3.to_checksum_address(user_address),
-                "gas": Config.WEB3_GAS_LIMIT,
-                "nonce": self.w3.eth.get_transaction_count(user_address)
-            })
+            tx = self._build_transaction(
+                self.contract.functions.endSession(session_id),
+                user_address
+            )
             
             # Envia transação
-            tx_hash = self.w3.eth.send_transaction(tx)
+            tx_hash = self._submit_transaction(tx)
             
             # Aguarda confirmação
-            receipt = self.w3.eth.wait_for_transaction_receipt(
-                tx_hash,
-                timeout=Config.WEB3_TIMEOUT
-            )
+            receipt = self._confirm_transaction(tx_hash)
             
             # Obtém evento de sessão finalizada
-            session_ended = self.contract.events.SessionEnded().process_receipt(receipt)[0]
+            session_ended = self._events["SessionEnded"].process_receipt(receipt)[0]
             
             # Retorna detalhes da sessão
             return self.get_session(session_id)
@@ -238,26 +355,22 @@ class Web3Adapter(BlockchainPort):
         """
         try:
             # Prepara transação
-            tx = self.contract.functions.reserveStation(
-                station_id,
-                int(start_time.timestamp())
-            ).build_transaction({
-                "from": self.w3.to_checksum_address(user_address),
-                "gas": Config.WEB3_GAS_LIMIT,
-                "nonce": self.w3.eth.get_transaction_count(user_address)
-            })
+            tx = self._build_transaction(
+                self.contract.functions.reserveStation(
+                    station_id,
+                    int(start_time.timestamp())
+                ),
+                user_address
+            )
             
             # Envia transação
-            tx_hash = self.w3.eth.send_transaction(tx)
+            tx_hash = self._submit_transaction(tx)
             
             # Aguarda confirmação
-            receipt = self.w3.eth.wait_for_transaction_receipt(
-                tx_hash,
-                timeout=Config.WEB3_TIMEOUT
-            )
+            receipt = self._confirm_transaction(tx_hash)
             
             # Obtém evento de reserva criada
-            reservation_created = self.contract.events.ReservationCreated().process_receipt(receipt)[0]
+            reservation_created = self._events["ReservationCreated"].process_receipt(receipt)[0]
             
             # Retorna detalhes da estação
             return self.get_station(station_id)
@@ -272,23 +385,19 @@ class Web3Adapter(BlockchainPort):
         """
         try:
             # Prepara transação
-            tx = self.contract.functions.cancelReservation(station_id).build_transaction({
-                "from": self.w3.to_checksum_address(user_address),
-                "gas": Config.WEB3_GAS_LIMIT,
-                "nonce": self.w3.eth.get_transaction_count(user_address)
-            })
+            tx = self._build_transaction(
+                self.contract.functions.cancelReservation(station_id),
+                user_address
+            )
             
             # Envia transação
-            tx_hash = self.w3.eth.send_transaction(tx)
+            tx_hash = self._submit_transaction(tx)
             
             # Aguarda confirmação
-            receipt = self.w3.eth.wait_for_transaction_receipt(
-                tx_hash,
-                timeout=Config.WEB3_TIMEOUT
-            )
+            receipt = self._confirm_transaction(tx_hash)
             
             # Obtém evento de reserva cancelada
-            reservation_cancelled = self.contract.events.ReservationCancelled().process_receipt(receipt)[0]
+            reservation_cancelled = self._events["ReservationCancelled"].process_receipt(receipt)[0]
             
             # Retorna detalhes da estação
             return self.get_station(station_id)
@@ -306,24 +415,20 @@ class Web3Adapter(BlockchainPort):
             amount_wei = int(amount * Decimal(10**18))
             
             # Prepara transação
-            tx = self.contract.functions.paySession(session_id).build_transaction({
-                "from": self.w3.to_checksum_address(user_address),
-                "value": amount_wei,
-                "gas": Config.WEB3_GAS_LIMIT,
-                "nonce": self.w3.eth.get_transaction_count(user_address)
-            })
+            tx = self._build_transaction(
+                self.contract.functions.paySession(session_id),
+                user_address,
+                value=amount_wei
+            )
             
             # Envia transação
-            tx_hash = self.w3.eth.send_transaction(tx)
+            tx_hash = self._submit_transaction(tx)
             
             # Aguarda confirmação
-            receipt = self.w3.eth.wait_for_transaction_receipt(
-                tx_hash,
-                timeout=Config.WEB3_TIMEOUT
-            )
+            receipt = self._confirm_transaction(tx_hash)
             
             # Obtém evento de pagamento processado
-            payment_processed = self.contract.events.PaymentProcessed().process_receipt(receipt)[0]
+            payment_processed = self._events["PaymentProcessed"].process_receipt(receipt)[0]
             
             # Retorna detalhes da sessão
             return self.get_session(session_id)
@@ -360,8 +465,7 @@ class Web3Adapter(BlockchainPort):
                 raise BlockchainInvalidAddressError(Texts.format(Texts.ERROR_BLOCKCHAIN_INVALID_ADDRESS, address))
 
             balance_wei = self.w3.eth.get_balance(self.w3.to_checksum_address(address))
-            balance_eth = self.w3.from_wei(balance_wei, "ether")
-            return Decimal(str(balance_eth))
+            return self._to_ether(balance_wei)
         except Exception as e:
             self.logger.error(Texts.format(Texts.ERROR_BLOCKCHAIN_BALANCE, str(e)))
             raise BlockchainError(Texts.format(Texts.ERROR_BLOCKCHAIN_BALANCE_FAILED, str(e)))
@@ -397,15 +501,15 @@ class Web3Adapter(BlockchainPort):
         Get details of a charging session from the blockchain.
         """
         try:
-            session_data = self.contract.functions.getSession(session_id).call()
+            session_data = self._cached_call("getSession", session_id)
             return {
                 "session_id": session_id,
                 "station_id": session_data[0],
                 "user_address": to_checksum_address(session_data[1]),
                 "start_time": datetime.fromtimestamp(session_data[2]),
                 "end_time": datetime.fromtimestamp(session_data[3]) if session_data[3] > 0 else None,
-                "energy_consumed": Decimal(str(self.w3.from_wei(session_data[4], "ether"))),
-                "amount_paid": Decimal(str(self.w3.from_wei(session_data[5], "ether"))),
+                "energy_consumed": self._to_ether(session_data[4]),
+                "amount_paid": self._to_ether(session_data[5]),
                 "status": session_data[6]
             }
         except Exception as e:
@@ -417,15 +521,15 @@ class Web3Adapter(BlockchainPort):
         Get details of a charging station from the blockchain.
         """
         try:
-            station_data = self.contract.functions.getStation(station_id).call()
+            station_data = self._cached_call("getStation", station_id)
             return {
                 "station_id": station_id,
                 "location": station_data[0],
                 "status": station_data[1],
                 "current_session_id": station_data[2],
                 "total_sessions": station_data[3],
-                "total_energy": Decimal(str(self.w3.from_wei(station_data[4], "ether"))),
-                "total_revenue": Decimal(str(self.w3.from_wei(station_data[5], "ether")))
+                "total_energy": self._to_ether(station_data[4]),
+                "total_revenue": self._to_ether(station_data[5])
             }
         except Exception as e:
             self.logger.error(Texts.format(Texts.ERROR_BLOCKCHAIN_STATION_DETAILS, str(e)))
@@ -439,12 +543,12 @@ class Web3Adapter(BlockchainPort):
             if not self.validate_address(user_address):
                 raise BlockchainInvalidAddressError(Texts.format(Texts.ERROR_BLOCKCHAIN_INVALID_ADDRESS, user_address))
 
-            user_data = self.contract.functions.getUser(user_address).call()
+            user_data = self._cached_call("getUser", user_address)
             return {
                 "user_address": to_checksum_address(user_address),
                 "total_sessions": user_data[0],
-                "total_energy": Decimal(str(self.w3.from_wei(user_data[1], "ether"))),
-                "total_spent": Decimal(str(self.w3.from_wei(user_data[2], "ether"))),
+                "total_energy": self._to_ether(user_data[1]),
+                "total_spent": self._to_ether(user_data[2]),
                 "last_session_id": user_data[3]
             }
         except Exception as e:
@@ -482,6 +586,153 @@ class Web3Adapter(BlockchainPort):
             self.logger.error(Texts.format(Texts.ERROR_WEB3_ADDRESS, str(e)))
             raise BlockchainInvalidAddressError(Texts.ERROR_WEB3_ADDRESS_FAILED)
 
+    def _cached_call(self, function_name: str, argument: Any) -> Any:
+        """
+        Executa uma função de leitura do contrato no bloco mais recente, reaproveitando
+        o retorno enquanto nenhum bloco novo for minerado. Como toda escrita gera um
+        bloco novo, não é preciso invalidar o cache depois das transações.
+        Guarda até Config.WEB3_READ_CACHE_SIZE leituras, descartando as menos usadas.
+        """
+        block_number = self.w3.eth.block_number
+        key = (function_name, argument, block_number)
+        if key in self._read_cache:
+            self._read_cache.move_to_end(key)
+            return self._read_cache[key]
+        
+        result = getattr(self.contract.functions, function_name)(argument).call(block_identifier=block_number)
+        self._read_cache[key] = result
+        if len(self._read_cache) > Config.WEB3_READ_CACHE_SIZE:
+            self._read_cache.popitem(last=False)
+        return result
+
+    def _multicall(self, functions: List[Any], allow_failure: bool = False) -> List[Any]:
+        """
+        Agrega chamadas de leitura do contrato em uma única eth_call ao Multicall3.
+        Falha se qualquer uma das chamadas reverter, a menos que allow_failure seja
+        True; nesse caso as chamadas revertidas retornam None.
+        """
+        calls = [
+            (self.contract.address, allow_failure, self.contract.encode_abi(function.fn_name, args=function.args))
+            for function in functions
+        ]
+        results = []
+        for function, (success, return_data) in zip(functions, self.multicall.functions.aggregate3(calls).call()):
+            if not success:
+                results.append(None)
+                continue
+            decoded = self.w3.codec.decode(get_abi_output_types(function.abi), return_data)
+            results.append(decoded[0] if len(decoded) == 1 else decoded)
+        return results
+
+    @staticmethod
+    def _call_or_none(function) -> Any:
+        """Executa uma leitura do contrato, retornando None se ela reverter."""
+        try:
+            return function.call()
+        except ContractLogicError:
+            return None
+
+    def _to_ether(self, value_wei: int) -> Decimal:
+        """Converte Wei para ETH sem passar por str (from_wei devolve int 0 para zero)."""
+        return Decimal(self.w3.from_wei(value_wei, "ether"))
+
+    def _format_session(self, session_id: int, session: tuple) -> Dict[str, Any]:
+        """
+        Converte o retorno de getSession no dicionário de sessão.
+        O contrato retorna (user, stationId, startTime, endTime, active, paid, amount).
+        """
+        if session[5]:
+            status = SessionStatus.PAID
+        elif session[4]:
+            status = SessionStatus.ACTIVE
+        else:
+            status = SessionStatus.COMPLETED
+        return {
+            "id": session_id,
+            "station_id": session[1],
+            "user_address": session[0],
+            "start_time": datetime.fromtimestamp(session[2]),
+            "end_time": datetime.fromtimestamp(session[3]) if session[3] > 0 else None,
+            "status": status.value,
+            "amount": self._to_ether(session[6]),  # Converter de Wei para ETH
+            "paid": session[5]
+        }
+
+    @staticmethod
+    def _session_entity(session: Dict[str, Any]) -> Session:
+        """Converte o dicionário de sessão (ver _format_session) na entidade Session."""
+        return Session(
+            id=session["id"],
+            user_address=session["user_address"],
+            station_id=session["station_id"],
+            start_time=session["start_time"],
+            end_time=session["end_time"],
+            status=SessionStatus(session["status"]),
+            payment_amount=session["amount"] if session["paid"] else None
+        )
+
+    def _format_station(self, station: tuple) -> Dict[str, Any]:
+        """Converte o retorno de getStation no dicionário de estação."""
+        return {
+            "id": station[0],
+            "location": station[1],
+            "status": station[2],
+            "current_session": station[3],
+            "reserved_until": datetime.fromtimestamp(station[4]) if station[4] > 0 else None,
+            "reserved_by": station[5] if station[5] != "0x0000000000000000000000000000000000000000" else None
+        }
+
+    def _build_transaction(self, function, user_address: str, value: int = 0) -> dict:
+        """
+        Monta uma transação de contrato.
+        Nonce e chainId são obtidos em uma única requisição JSON-RPC em lote
+        (ver _batch_call); as taxas ficam a cargo do web3.
+        """
+        try:
+            sender = self.w3.to_checksum_address(user_address)
+            nonce, chain_id = self._batch_call([
+                lambda: self.w3.eth.get_transaction_count(sender),
+                lambda: self.w3.eth.chain_id
+            ])
+
+            return function.build_transaction({
+                "from": sender,
+                "value": value,
+                "gas": Config.WEB3_GAS_LIMIT,
+                "nonce": nonce,
+                "chainId": chain_id
+            })
+        except Exception as e:
+            self.logger.error(Texts.format(Texts.ERROR_WEB3_BUILD, str(e)))
+            raise BlockchainTransactionError(Texts.format(Texts.ERROR_WEB3_BUILD, str(e)))
+
+    def _batch_call(self, requests: List[Callable[[], Any]]) -> List[Any]:
+        """
+        Executa leituras independentes em uma única requisição JSON-RPC em lote.
+        Provedores sem suporte a lote (ex.: EthereumTesterProvider) fazem uma
+        requisição por leitura.
+        """
+        try:
+            batch = self.w3.batch_requests()
+        except Web3TypeError:
+            return [request() for request in requests]
+        with batch:
+            for request in requests:
+                batch.add(request())
+            return batch.execute()
+
+    def _submit_transaction(self, transaction: dict) -> bytes:
+        """Envia uma transação montada por _build_transaction."""
+        return self.w3.eth.send_transaction(transaction)
+
+    def _confirm_transaction(self, tx_hash: bytes) -> dict:
+        """Aguarda o recibo de uma transação enviada por _submit_transaction."""
+        return self.w3.eth.wait_for_transaction_receipt(
+            tx_hash,
+            timeout=Config.WEB3_TIMEOUT,
+            poll_latency=Config.WEB3_POLL_LATENCY
+        )
+
     def _get_nonce(self, address: str) -> int:
         """Obtém o nonce da conta."""
         try:
@@ -501,7 +752,7 @@ class Web3Adapter(BlockchainPort):
     def _sign_transaction(self, transaction: dict, private_key: str) -> bytes:
         """Assina uma transação."""
         try:
-            return self.w3.eth.account.sign_transaction(transaction, private_key).rawTransaction
+            return self.w3.eth.account.sign_transaction(transaction, private_key).raw_transaction
         except Exception as e:
             self.logger.error(Texts.format(Texts.ERROR_WEB3_SIGN, str(e)))
             raise BlockchainError(Texts.ERROR_WEB3_SIGN_FAILED)
@@ -519,7 +770,10 @@ class Web3Adapter(BlockchainPort):
     def _wait_for_transaction(self, tx_hash: str) -> dict:
         """Aguarda a confirmação de uma transação."""
         try:
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = self.w3.eth.wait_for_transaction_receipt(
+                tx_hash,
+                poll_latency=Config.WEB3_POLL_LATENCY
+            )
             self.logger.info(Texts.format(Texts.LOG_WEB3_CONFIRMATION, tx_hash))
             return receipt
         except Exception as e:
@@ -539,15 +793,9 @@ class Web3Adapter(BlockchainPort):
     async def get_reservation(self, reservation_id: int):
         raise NotImplementedError("get_reservation não implementado")
 
-    async def get_user_sessions(self, user_address: str, status=None):
-        raise NotImplementedError("get_user_sessions não implementado")
-
     async def get_user_reservations(self, user_address: str, status=None):
         raise NotImplementedError("get_user_reservations não implementado")
 
-    async def get_station_sessions(self, station_id: int, status=None):
-        raise NotImplementedError("get_station_sessions não implementado")
-
     async def get_station_reservations(self, station_id: int, status=None):
         raise NotImplementedError("get_station_reservations não implementado")
 
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 from typing import Optional
@@ -15,6 +15,10 @@ class SessionStatus(Enum):
     CANCELLED = "cancelled"  # Sessão cancelada
 
 
+# Mapa valor -> estado, evitando a busca do construtor do Enum a cada conversão
+_STATUS_BY_VALUE = {status.value: status for status in SessionStatus}
+
+
 class Session:
     """
     Entidade que representa uma sessão de carregamento.
@@ -88,6 +92,28 @@ class Session:
         """
         self.status = SessionStatus.CANCELLED
 
+    @property
+    def is_active(self) -> bool:
+        """Indica se a sessão está em andamento."""
+        return self.status is SessionStatus.ACTIVE
+
+    @property
+    def is_paid(self) -> bool:
+        """Indica se a sessão já foi paga."""
+        return self.status is SessionStatus.PAID
+
+    @property
+    def duration(self) -> Optional[timedelta]:
+        """A duração da sessão, ou None se ela não tiver sido finalizada."""
+        if not self.start_time or not self.end_time:
+            return None
+        return self.end_time - self.start_time
+
+    @property
+    def duration_hours(self) -> Optional[float]:
+        """A duração da sessão em horas (ver get_duration)."""
+        return self.get_duration()
+
     def get_duration(self) -> Optional[float]:
         """
         Calcula a duração da sessão em horas.
@@ -130,13 +156,18 @@ class Session:
         Returns:
             Uma nova instância de Session
         """
+        parse_datetime = datetime.fromisoformat
+        start_time = data["start_time"]
+        end_time = data["end_time"]
+        payment_amount = data["payment_amount"]
+        payment_time = data["payment_time"]
         return cls(
             id=data["id"],
             user_address=data["user_address"],
             station_id=data["station_id"],
-            start_time=datetime.fromisoformat(data["start_time"]) if data["start_time"] else None,
-            end_time=datetime.fromisoformat(data["end_time"]) if data["end_time"] else None,
-            status=SessionStatus(data["status"]),
-            payment_amount=Decimal(data["payment_amount"]) if data["payment_amount"] else None,
-            payment_time=datetime.fromisoformat(data["payment_time"]) if data["payment_time"] else None
+            start_time=parse_datetime(start_time) if start_time else None,
+            end_time=parse_datetime(end_time) if end_time else None,
+            status=_STATUS_BY_VALUE.get(data["status"]) or SessionStatus(data["status"]),
+            payment_amount=Decimal(payment_amount) if payment_amount else None,
+            payment_time=parse_datetime(payment_time) if payment_time else None
         ) 
\ No newline at end of file
@@ -1,6 +1,34 @@
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from domain.exceptions.custom_exceptions import ResourceConflictError
+from shared.constants.texts import Texts
+
+_START_TIME = attrgetter("start_time")
+_ZERO = Decimal(0)
+
+
+class StationReservation(NamedTuple):
+    """Reserva de um intervalo de horário em uma estação."""
+    user_address: str
+    start_time: datetime
+    end_time: datetime
+
+
+def _start_day(reservation: StationReservation) -> int:
+    """Retorna o dia de início da reserva como ordinal, usado para agrupá-las."""
+    return reservation.start_time.toordinal()
+
+
+@lru_cache(maxsize=1024)
+def _iso_date(day: int) -> str:
+    """Converte o ordinal de um dia na data AAAA-MM-DD usada como chave das reservas."""
+    return date.fromordinal(day).isoformat()
 
 
 class Station:
@@ -17,9 +45,9 @@ class Station:
         price_per_hour: Decimal,
         is_available: bool = True,
         current_session_id: Optional[int] = None,
-        reservations: Optional[Dict[str, List[Dict[str, any]]]] = None,
+        reservations: Optional[Dict[str, List[StationReservation]]] = None,
         total_sessions: int = 0,
-        total_revenue: Decimal = Decimal('0')
+        total_revenue: Decimal = _ZERO
     ):
         """
         Inicializa uma nova estação.
@@ -41,7 +69,7 @@ class Station:
         self.price_per_hour = price_per_hour
         self.is_available = is_available
         self.current_session_id = current_session_id
-        self.reservations = reservations or {}
+        self._index_reservations(reservations or {})
         self.total_sessions = total_sessions
         self.total_revenue = total_revenue
 
@@ -58,16 +86,22 @@ class Station:
             user_address: O endereço da carteira do usuário
             start_time: O horário de início da reserva
             end_time: O horário de fim da reserva
+            
+        Raises:
+            ResourceConflictError: Se o horário se sobrepuser a outra reserva
         """
-        date_key = start_time.strftime("%Y-%m-%d")
-        if date_key not in self.reservations:
-            self.reservations[date_key] = []
+        index = bisect_left(self._starts, end_time)
+        if self._overlapping:
+            conflict = any(end > start_time for end in self._ends[:index])
+        else:
+            conflict = index and self._ends[index - 1] > start_time
+        if conflict:
+            raise ResourceConflictError(Texts.ERROR_STATION_ALREADY_RESERVED, self.id, start_time.isoformat())
 
-        self.reservations[date_key].append({
-            "user_address": user_address,
-            "start_time": start_time,
-            "end_time": end_time
-        })
+        self._starts.insert(index, start_time)
+        self._ends.insert(index, end_time)
+        self._entries.insert(index, StationReservation(user_address, start_time, end_time))
+        self._reservations_by_date = None
 
     def remove_reservation(
         self,
@@ -83,16 +117,31 @@ class Station:
             start_time: O horário de início da reserva
             end_time: O horário de fim da reserva
         """
-        date_key = start_time.strftime("%Y-%m-%d")
-        if date_key in self.reservations:
-            self.reservations[date_key] = [
-                r for r in self.reservations[date_key]
-                if not (
-                    r["user_address"] == user_address and
-                    r["start_time"] == start_time and
-                    r["end_time"] == end_time
-                )
-            ]
+        reservation = StationReservation(user_address, start_time, end_time)
+        index = bisect_left(self._starts, start_time)
+        while index < len(self._starts) and self._starts[index] == start_time:
+            if self._entries[index] == reservation:
+                del self._starts[index], self._ends[index], self._entries[index]
+                self._reservations_by_date = None
+            else:
+                index += 1
+
+    @property
+    def reservations(self) -> Dict[str, List[StationReservation]]:
+        """
+        Reservas da estação agrupadas pela data de início.
+        
+        O agrupamento é montado a partir da linha do tempo e reaproveitado até a
+        próxima alteração das reservas. Cada leitura recebe uma cópia, então
+        alterá-la não afeta a estação; para isso, use add_reservation e
+        remove_reservation.
+        """
+        if self._reservations_by_date is None:
+            self._reservations_by_date = {
+                _iso_date(day): tuple(date_reservations)
+                for day, date_reservations in groupby(self._entries, key=_start_day)
+            }
+        return {day: list(date_reservations) for day, date_reservations in self._reservations_by_date.items()}
 
     def is_reserved_at(self, time: datetime) -> bool:
         """
@@ -104,14 +153,7 @@ class Station:
         Returns:
             True se a estação estiver reservada, False caso contrário
         """
-        date_key = time.strftime("%Y-%m-%d")
-        if date_key not in self.reservations:
-            return False
-
-        return any(
-            r["start_time"] <= time <= r["end_time"]
-            for r in self.reservations[date_key]
-        )
+        return self._find_reservation_at(time) is not None
 
     def get_reservation_user(self, time: datetime) -> Optional[str]:
         """
@@ -123,14 +165,71 @@ class Station:
         Returns:
             O endereço da carteira do usuário com reserva, ou None se não houver
         """
-        date_key = time.strftime("%Y-%m-%d")
-        if date_key not in self.reservations:
+        reservation = self._find_reservation_at(time)
+        return reservation.user_address if reservation is not None else None
+
+    def _find_reservation_at(self, time: datetime) -> Optional[StationReservation]:
+        """
+        Encontra a reserva que cobre um horário com uma única busca binária.
+        
+        Se as reservas carregadas se sobrepõem, a busca volta pelas reservas
+        anteriores, já que os fins deixam de estar ordenados.
+        
+        Args:
+            time: O horário a ser verificado
+            
+        Returns:
+            A reserva que cobre o horário, ou None se não houver
+        """
+        index = bisect_right(self._starts, time)
+        if not self._overlapping:
+            if index and time <= self._ends[index - 1]:
+                return self._entries[index - 1]
             return None
+        for previous in range(index - 1, -1, -1):
+            if time <= self._ends[previous]:
+                return self._entries[previous]
+        return None
 
-        for reservation in self.reservations[date_key]:
-            if reservation["start_time"] <= time <= reservation["end_time"]:
-                return reservation["user_address"]
+    def _index_reservations(self, reservations: Dict[str, List[StationReservation]]) -> None:
+        """
+        Monta a linha do tempo das reservas da estação.
+        
+        As reservas ficam em listas paralelas de inícios, fins e reservas ordenadas
+        por início; o agrupamento por data só é montado quando lido (ver
+        reservations). Sem sobreposições, os fins também ficam ordenados, e as
+        consultas por horário e a verificação de sobreposição viram uma busca
+        binária, inclusive para reservas que atravessam a meia-noite.
+        
+        As reservas recebidas são dados já persistidos e podem se sobrepor; nesse
+        caso as consultas passam a percorrer as reservas anteriores (ver
+        from_dict para recusá-las na carga).
+        
+        Args:
+            reservations: Dicionário de reservas por data
+        """
+        self._reservations_by_date: Optional[Dict[str, Tuple[StationReservation, ...]]] = None
+        self._entries: List[StationReservation] = sorted(
+            (r for date_reservations in reservations.values() for r in date_reservations),
+            key=_START_TIME
+        )
+        self._starts: List[datetime] = [r.start_time for r in self._entries]
+        self._ends: List[datetime] = [r.end_time for r in self._entries]
+        self._overlapping = self._first_overlap() is not None
 
+    def _first_overlap(self) -> Optional[int]:
+        """
+        Encontra a primeira reserva que se sobrepõe à anterior na linha do tempo.
+        
+        Com as reservas ordenadas por início, qualquer sobreposição aparece entre
+        duas reservas vizinhas, então basta uma passada.
+        
+        Returns:
+            A posição da reserva, ou None se não houver sobreposição
+        """
+        for index in range(1, len(self._starts)):
+            if self._starts[index] < self._ends[index - 1]:
+                return index
         return None
 
     def start_session(self, session_id: int) -> None:
@@ -177,9 +276,9 @@ class Station:
             "reservations": {
                 date: [
                     {
-                        "user_address": r["user_address"],
-                        "start_time": r["start_time"].isoformat(),
-                        "end_time": r["end_time"].isoformat()
+                        "user_address": r.user_address,
+                        "start_time": r.start_time.isoformat(),
+                        "end_time": r.end_time.isoformat()
                     }
                     for r in reservations
                 ]
@@ -190,28 +289,32 @@ class Station:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'Station':
+    def from_dict(cls, data: dict, validate_reservations: bool = False) -> 'Station':
         """
         Cria uma estação a partir de um dicionário.
         
         Args:
             data: O dicionário com os dados da estação
+            validate_reservations: Se True, recusa reservas que se sobrepõem
             
         Returns:
             Uma nova instância de Station
+            
+        Raises:
+            ResourceConflictError: Se validate_reservations for True e as reservas se sobrepuserem
         """
         reservations = {}
         for date, date_reservations in data["reservations"].items():
             reservations[date] = [
-                {
-                    "user_address": r["user_address"],
-                    "start_time": datetime.fromisoformat(r["start_time"]),
-                    "end_time": datetime.fromisoformat(r["end_time"])
-                }
+                StationReservation(
+                    r["user_address"],
+                    datetime.fromisoformat(r["start_time"]),
+                    datetime.fromisoformat(r["end_time"])
+                )
                 for r in date_reservations
             ]
 
-        return cls(
+        station = cls(
             id=data["id"],
             location=data["location"],
             power_output=Decimal(data["power_output"]),
@@ -221,4 +324,12 @@ class Station:
             reservations=reservations,
             total_sessions=data["total_sessions"],
             total_revenue=Decimal(data["total_revenue"])
-        ) 
\ No newline at end of file
+        )
+
+        if validate_reservations and station._overlapping:
+            index = station._first_overlap()
+            raise ResourceConflictError(
+                Texts.ERROR_STATION_ALREADY_RESERVED, station.id, station._starts[index].isoformat()
+            )
+
+        return station 
\ No newline at end of file
@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Set
 from decimal import Decimal
 
+_ZERO = Decimal(0)
+
 
 @dataclass
 class User:
@@ -20,6 +22,14 @@ class User:
     total_sessions: int
     active_reservations: List[int]
     last_login: Optional[datetime] = None
+    # Conjuntos espelhando as listas ativas para verificar pertinência em O(1);
+    # as listas continuam sendo a visão pública e serializada
+    _session_ids: Set[int] = field(init=False, repr=False, compare=False)
+    _reservation_ids: Set[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._session_ids = set(self.active_sessions)
+        self._reservation_ids = set(self.active_reservations)
 
     def add_session(self, session_id: int) -> None:
         """
@@ -28,7 +38,8 @@ class User:
         Args:
             session_id: O ID da sessão a ser adicionada
         """
-        if session_id not in self.active_sessions:
+        if session_id not in self._session_ids:
+            self._session_ids.add(session_id)
             self.active_sessions.append(session_id)
 
     def remove_session(self, session_id: int) -> None:
@@ -38,7 +49,8 @@ class User:
         Args:
             session_id: O ID da sessão a ser removida
         """
-        if session_id in self.active_sessions:
+        if session_id in self._session_ids:
+            self._session_ids.discard(session_id)
             self.active_sessions.remove(session_id)
 
     def update_last_login(self) -> None:
@@ -64,7 +76,8 @@ class User:
         Args:
             reservation_id: O ID da reserva a ser adicionada
         """
-        if reservation_id not in self.active_reservations:
+        if reservation_id not in self._reservation_ids:
+            self._reservation_ids.add(reservation_id)
             self.active_reservations.append(reservation_id)
 
     def remove_reservation(self, reservation_id: int) -> None:
@@ -74,7 +87,8 @@ class User:
         Args:
             reservation_id: O ID da reserva a ser removida
         """
-        if reservation_id in self.active_reservations:
+        if reservation_id in self._reservation_ids:
+            self._reservation_ids.discard(reservation_id)
             self.active_reservations.remove(reservation_id)
 
     def to_dict(self) -> dict:
@@ -134,7 +148,7 @@ class User:
             created_at=datetime.utcnow(),
             last_login=None,
             active_sessions=[],
-            total_charges=Decimal('0'),
+            total_charges=_ZERO,
             total_sessions=0,
             active_reservations=[]
         ) 
\ No newline at end of file
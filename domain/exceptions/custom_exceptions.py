@@ -2,10 +2,21 @@ from shared.constants.texts import Texts
 
 class EVChargingException(Exception):
     """Base exception for EV Charging application."""
-    def __init__(self, message: str, error_code: str):
-        self.message = message
+    def __init__(self, message: str, error_code: str, *format_args):
+        # Com format_args, a mensagem é um modelo de Texts formatado só quando lido
+        self._template = message
+        self._format_args = format_args
         self.error_code = error_code
-        super().__init__(message)
+        super().__init__(message, *format_args)
+
+    @property
+    def message(self) -> str:
+        if self._format_args:
+            return Texts.format(self._template, *self._format_args)
+        return self._template
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class AuthenticationError(EVChargingException):
@@ -147,8 +158,8 @@ class UserNotFoundError(EVChargingException):
 
 class ValidationError(EVChargingException):
     """Raised when there are validation issues."""
-    def __init__(self, message: str):
-        super().__init__(message, "VALIDATION_ERROR")
+    def __init__(self, message: str, *format_args):
+        super().__init__(message, "VALIDATION_ERROR", *format_args)
 
 
 class ResourceNotFoundError(EVChargingException):
@@ -159,8 +170,8 @@ class ResourceNotFoundError(EVChargingException):
 
 class ResourceConflictError(EVChargingException):
     """Raised when there is a conflict with a resource."""
-    def __init__(self, message: str):
-        super().__init__(message, "RESOURCE_CONFLICT")
+    def __init__(self, message: str, *format_args):
+        super().__init__(message, "RESOURCE_CONFLICT", *format_args)
 
 
 class StationInUseError(ResourceConflictError):
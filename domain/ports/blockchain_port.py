@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from domain.entities.session import Session
 from domain.entities.station import Station
@@ -71,6 +71,22 @@ class BlockchainPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_sessions_batch(self, session_ids: Sequence[int]) -> List[Session]:
+        """
+        Obtém os dados de várias sessões em uma única requisição à blockchain.
+        
+        Args:
+            session_ids: Os IDs das sessões
+            
+        Returns:
+            Lista de objetos Session na ordem dos IDs; sessões inexistentes são omitidas
+            
+        Raises:
+            BlockchainError: Se houver erro na comunicação com a blockchain
+        """
+        pass
+
     @abstractmethod
     async def get_reservation(self, reservation_id: int) -> Any:
         """
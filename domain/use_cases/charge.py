@@ -266,14 +266,52 @@ class ChargeUseCase:
         except UserNotFoundError:
             raise UserNotFoundError(user_address)
 
-        # Get all sessions for user
+        # Get all sessions for user in a single blockchain request
+        # (sessions that don't exist are left out by the port)
+        session_ids = user.active_sessions if active_only else range(1, user.total_sessions + 1)
         sessions = []
-        for session_id in user.active_sessions if active_only else range(1, user.total_sessions + 1):
-            try:
-                session = await self.blockchain_port.get_session(session_id)
-                if session.user_address == user_address:
-                    sessions.append(await self.http_port.format_session_response(session))
-            except SessionNotFoundError:
+        for session in await self.blockchain_port.get_sessions_batch(list(session_ids)):
+            if session.user_address == user_address:
+                sessions.append(await self.http_port.format_session_response(session))
+
+        return sessions
+
+    async def get_station_sessions(
+        self,
+        station_id: int,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> list[dict]:
+        """
+        Get all sessions for a station.
+        
+        Args:
+            station_id: The ID of the station
+            status: Optional filter by session status
+            start_date: Optional filter for sessions started from this date
+            end_date: Optional filter for sessions started until this date
+            
+        Returns:
+            A list of dictionaries with session details
+            
+        Raises:
+            StationNotFoundError: If the station doesn't exist
+        """
+        # Get station
+        try:
+            await self.blockchain_port.get_station(station_id)
+        except StationNotFoundError:
+            raise StationNotFoundError(station_id)
+
+        # Get the station's sessions (session IDs are global, so the port reads
+        # them from the station's own index on the blockchain)
+        sessions = []
+        for session in await self.blockchain_port.get_station_sessions(station_id, status):
+            if start_date and session.start_time < start_date:
+                continue
+            if end_date and session.start_time > end_date:
                 continue
+            sessions.append(await self.http_port.format_session_response(session))
 
-        return sessions 
\ No newline at end of file
+        return sessions
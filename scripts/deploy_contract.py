@@ -98,7 +98,7 @@ def deploy_contract(compiled_sol):
 
         # Assina e envia transação
         signed_txn = w3.eth.account.sign_transaction(transaction, deployer_key)
-        tx_hash = w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
 
         # Aguarda confirmação
         receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
@@ -22,8 +22,12 @@ class Config:
     WEB3_PROVIDER = "ganache"  # Usando Ganache para desenvolvimento
     WEB3_PROVIDER_URL = os.getenv("WEB3_PROVIDER_URL", "http://ganache:8545")
     WEB3_CONTRACT_ADDRESS = os.getenv("WEB3_CONTRACT_ADDRESS")
+    WEB3_BATCH_SIZE = int(os.getenv("WEB3_BATCH_SIZE", "50"))  # Máximo de leituras por requisição em lote
+    WEB3_MULTICALL_ADDRESS = os.getenv("WEB3_MULTICALL_ADDRESS")  # Multicall3 opcional para leituras agregadas
     WEB3_GAS_LIMIT = 3000000  # Limite de gas para transações
     WEB3_TIMEOUT = 120  # Timeout em segundos para transações
+    WEB3_READ_CACHE_SIZE = 1024  # Máximo de leituras do contrato (sessão, estação, usuário) mantidas em cache
+    WEB3_POLL_LATENCY = float(os.getenv("WEB3_POLL_LATENCY", "0.1"))  # Intervalo em segundos entre consultas de recibo
     
     # API
     API_HOST = os.getenv("API_HOST", "0.0.0.0")
@@ -359,6 +359,7 @@ class Texts:
     ERROR_WEB3_CONNECT = "Erro ao conectar à rede blockchain: {}"
     ERROR_WEB3_DISCONNECT = "Erro ao desconectar da rede blockchain: {}"
     ERROR_WEB3_TRANSACTION = "Erro ao enviar transação: {}"
+    ERROR_WEB3_BUILD = "Erro ao montar transação: {}"
     ERROR_WEB3_CONFIRMATION = "Erro ao confirmar transação: {}"
     ERROR_WEB3_CONTRACT = "Erro ao interagir com contrato: {}"
     ERROR_WEB3_ADDRESS = "Endereço inválido: {}"
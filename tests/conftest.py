@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -10,26 +11,55 @@ from domain.ports.http_port import HTTPPort
 from domain.ports.blockchain_port import BlockchainPort
 from adapters.http.flask_adapter import FlaskAdapter
 from adapters.blockchain.web3_adapter import Web3Adapter
+from tests.data import VALID_SESSION_DATA, VALID_PAYMENT_DATA
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Fixture que substitui o laço de eventos do pytest-asyncio por um único laço
+    compartilhado por todos os testes assíncronos da sessão.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+# Horário fixo para os testes: evita várias leituras do relógio por teste e
+# resultados que mudam quando o teste atravessa a meia-noite
+FIXED_NOW = datetime(2024, 2, 20, 12, 0, 0)
+
+@pytest.fixture(scope="session")
+def now():
+    """Fixture que retorna o horário de referência dos testes."""
+    return FIXED_NOW
 
 # Fixtures para entidades
-@pytest.fixture
-def mock_user():
-    """Fixture que retorna um usuário de teste."""
+def _build_user() -> User:
+    """Cria um usuário de teste."""
     return User(
+        id=1,
         wallet_address="0x1234567890123456789012345678901234567890",
         email="test@example.com",
         name="Test User",
-        created_at=datetime.utcnow(),
-        last_login=datetime.utcnow(),
+        created_at=FIXED_NOW,
+        last_login=FIXED_NOW,
         active_sessions=[],
         total_charges=Decimal('0.0'),
         total_sessions=0,
         active_reservations=[]
     )
 
+@pytest.fixture(scope="session")
+def user_factory():
+    """Fixture que retorna a função que cria usuários de teste novos a cada chamada."""
+    return _build_user
+
 @pytest.fixture
-def mock_station():
-    """Fixture que retorna uma estação de teste."""
+def mock_user(user_factory):
+    """Fixture que retorna um usuário de teste."""
+    return user_factory()
+
+def _build_station() -> Station:
+    """Cria uma estação de teste disponível."""
     return Station(
         id=1,
         location="Test Location",
@@ -42,20 +72,47 @@ def mock_station():
         total_revenue=Decimal('0.0')
     )
 
+@pytest.fixture(scope="session")
+def station_factory():
+    """Fixture que retorna a função que cria estações de teste novas a cada chamada."""
+    return _build_station
+
 @pytest.fixture
-def mock_session():
-    """Fixture que retorna uma sessão de teste."""
+def mock_station(station_factory):
+    """Fixture que retorna uma estação de teste."""
+    return station_factory()
+
+def _build_session(session_id: int = 1) -> Session:
+    """Cria uma sessão ativa de teste com o ID informado."""
     return Session(
-        id=1,
+        id=session_id,
         user_address="0x1234567890123456789012345678901234567890",
         station_id=1,
-        start_time=datetime.utcnow(),
+        start_time=FIXED_NOW,
         end_time=None,
         status=SessionStatus.ACTIVE,
         payment_amount=None,
         payment_time=None
     )
 
+@pytest.fixture(scope="session")
+def session_factory():
+    """Fixture que retorna a função que cria sessões de teste novas a cada chamada."""
+    return _build_session
+
+@pytest.fixture
+def mock_session(session_factory):
+    """Fixture que retorna uma sessão de teste."""
+    return session_factory()
+
+@pytest.fixture(scope="session")
+def mock_session_pool():
+    """
+    Fixture que retorna sessões de teste criadas uma única vez.
+    Só deve ser usada por testes que apenas leem as sessões; para alterá-las, use mock_session.
+    """
+    return tuple(_build_session(session_id) for session_id in range(1, 5))
+
 # Fixtures para adaptadores
 @pytest.fixture
 def mock_http_port():
@@ -65,9 +122,10 @@ def mock_http_port():
     # Configurar comportamentos padrão
     mock.validate_wallet_address.return_value = True
     mock.validate_signature.return_value = True
-    mock.parse_datetime.return_value = datetime.utcnow()
+    mock.parse_datetime.return_value = FIXED_NOW
     mock.parse_decimal.return_value = Decimal('0.001')
     mock.create_response.return_value = {"success": True, "data": {}}
+    mock.format_session_response.side_effect = lambda session: session.to_dict()
     mock.handle_error.return_value = {"success": False, "error": "Test error"}
     
     return mock
@@ -78,9 +136,9 @@ def mock_blockchain_port():
     mock = AsyncMock(spec=BlockchainPort)
     
     # Configurar comportamentos padrão
-    mock.get_user.return_value = mock_user()
-    mock.get_station.return_value = mock_station()
-    mock.get_session.return_value = mock_session()
+    mock.get_user.return_value = _build_user()
+    mock.get_station.return_value = _build_station()
+    mock.get_session.return_value = _build_session()
     mock.verify_signature.return_value = True
     mock.get_eth_balance.return_value = Decimal('1.0')
     
@@ -106,7 +164,7 @@ def mock_payment_use_case(mock_http_port, mock_blockchain_port):
     )
 
 # Fixtures para dados de teste
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_wallet_address():
     """Fixture que retorna um endereço de carteira válido."""
     return "0x1234567890123456789012345678901234567890"
@@ -119,12 +177,12 @@ def valid_signature():
 @pytest.fixture
 def valid_datetime_str():
     """Fixture que retorna uma string de data/hora válida."""
-    return datetime.utcnow().isoformat()
+    return FIXED_NOW.isoformat()
 
 @pytest.fixture
 def valid_reservation_data():
     """Fixture que retorna dados válidos para uma reserva."""
-    start_time = datetime.utcnow() + timedelta(hours=1)
+    start_time = FIXED_NOW + timedelta(hours=1)
     return {
         "station_id": 1,
         "start_time": start_time.isoformat(),
@@ -134,18 +192,9 @@ def valid_reservation_data():
 @pytest.fixture
 def valid_session_data():
     """Fixture que retorna dados válidos para uma sessão."""
-    return {
-        "station_id": 1,
-        "wallet_address": "0x1234567890123456789012345678901234567890",
-        "signature": "0x1234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890"
-    }
+    return VALID_SESSION_DATA
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_payment_data():
     """Fixture que retorna dados válidos para um pagamento."""
-    return {
-        "session_id": 1,
-        "amount": "0.001",
-        "wallet_address": "0x1234567890123456789012345678901234567890",
-        "signature": "0x1234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890"
-    } 
\ No newline at end of file
+    return VALID_PAYMENT_DATA
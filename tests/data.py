@@ -0,0 +1,20 @@
+"""
+Dados de teste compartilhados pelos módulos de teste.
+Os conftest os expõem como fixtures; módulos que precisam dos valores em
+tempo de importação (ex.: em parâmetros de pytest.mark.parametrize) os importam daqui.
+"""
+from types import MappingProxyType
+
+# Dados imutáveis: nenhum teste altera o dicionário, então a mesma instância é reaproveitada
+VALID_SESSION_DATA = MappingProxyType({
+    "station_id": 1,
+    "wallet_address": "0x1234567890123456789012345678901234567890",
+    "signature": "0x1234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890"
+})
+
+VALID_PAYMENT_DATA = MappingProxyType({
+    "session_id": 1,
+    "amount": "0.001",
+    "wallet_address": "0x1234567890123456789012345678901234567890",
+    "signature": "0x1234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890"
+})
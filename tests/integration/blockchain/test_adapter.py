@@ -1,8 +1,8 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
-from web3 import Web3
-from eth_account import Account
+from web3.exceptions import TimeExhausted
 from eth_utils import to_checksum_address
 
 from adapters.blockchain.blockchain_adapter import BlockchainAdapter
@@ -14,57 +14,28 @@ from domain.exceptions.custom_exceptions import (
     BlockchainError
 )
 
-@pytest.fixture
-def web3():
-    """Fixture que cria uma instância do Web3 para testes."""
-    return Web3(Web3.HTTPProvider("http://localhost:8545"))
+from tests.integration.conftest import deploy_contract
 
-@pytest.fixture
-def account():
-    """Fixture que cria uma conta Ethereum para testes."""
-    return Account.create()
+pytestmark = pytest.mark.usefixtures("chain_snapshot")
 
-@pytest.fixture
-def contract_address(web3, account):
-    """Fixture que implanta o contrato e retorna seu endereço."""
-    # Compilar o contrato
-    with open("contracts/EVCharging.sol", "r") as f:
-        contract_source = f.read()
-    
-    # Deploy do contrato
-    contract = web3.eth.contract(
-        abi=contract_abi,  # ABI do contrato
-        bytecode=contract_bytecode  # Bytecode do contrato
-    )
-    
-    # Construir transação
-    transaction = contract.constructor().build_transaction({
-        "from": account.address,
-        "nonce": web3.eth.get_transaction_count(account.address),
-        "gas": 2000000,
-        "gasPrice": web3.eth.gas_price
-    })
-    
-    # Assinar e enviar transação
-    signed_txn = web3.eth.account.sign_transaction(transaction, account.key)
-    tx_hash = web3.eth.send_raw_transaction(signed_txn.rawTransaction)
-    tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
-    
-    return tx_receipt.contractAddress
+@pytest.fixture(scope="session")
+def contract_address(web3, signer, compiled_contract):
+    """Fixture que implanta o contrato uma única vez e retorna seu endereço."""
+    return deploy_contract(web3, compiled_contract)
 
 @pytest.fixture
 def blockchain_adapter(web3, contract_address):
     """Fixture que cria uma instância do adaptador blockchain para testes."""
     return BlockchainAdapter(web3, contract_address)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_wallet_address(account):
     """Fixture que retorna um endereço de carteira válido para testes."""
     return to_checksum_address(account.address)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_signature(web3, account):
-    """Fixture que retorna uma assinatura válida para testes."""
+    """Fixture que retorna uma assinatura válida para testes, calculada uma única vez."""
     message = "Test message"
     message_hash = web3.keccak(text=message)
     signed_message = web3.eth.account.sign_message(message_hash, account.key)
@@ -95,6 +66,7 @@ def test_adapter_transaction_building(blockchain_adapter, valid_wallet_address):
     assert "nonce" in transaction
     assert "gas" in transaction
     assert "gasPrice" in transaction
+    assert "chainId" in transaction
     assert "data" in transaction
 
 def test_adapter_transaction_signing(blockchain_adapter, web3, account):
@@ -108,7 +80,7 @@ def test_adapter_transaction_signing(blockchain_adapter, web3, account):
     # Assinar transação
     signed_txn = blockchain_adapter._sign_transaction(transaction, account.key)
     
-    assert signed_txn.rawTransaction is not None
+    assert signed_txn.raw_transaction is not None
     assert signed_txn.hash is not None
     assert signed_txn.r is not None
     assert signed_txn.s is not None
@@ -136,21 +108,62 @@ def test_adapter_transaction_sending(blockchain_adapter, web3, account):
     assert receipt["status"] == 1
     assert receipt["contractAddress"] is None
 
-def test_adapter_event_handling(blockchain_adapter, valid_wallet_address):
-    """Testa o tratamento de eventos."""
-    # Criar usuário para gerar evento
-    blockchain_adapter.create_user(valid_wallet_address)
-    
-    # Obter eventos
-    events = blockchain_adapter._get_events(
-        blockchain_adapter.contract.events.UserCreated,
-        from_block=0
-    )
-    
-    assert len(events) > 0
-    assert events[0]["args"]["walletAddress"] == valid_wallet_address
+class TestUserReads:
+    """Testes de leitura que compartilham um único usuário criado na blockchain."""
+
+    @pytest.fixture(scope="class", autouse=True)
+    def created_user(self, web3, contract_address, valid_wallet_address):
+        """Fixture que cria o usuário uma única vez para todos os testes da classe."""
+        snapshot_id = web3.provider.make_request("evm_snapshot", [])["result"]
+        yield BlockchainAdapter(web3, contract_address).create_user(valid_wallet_address)
+        web3.provider.make_request("evm_revert", [snapshot_id])
+
+    def test_adapter_event_handling(self, blockchain_adapter, valid_wallet_address):
+        """Testa o tratamento de eventos."""
+        # Obter eventos
+        events = blockchain_adapter._get_events(
+            blockchain_adapter.contract.events.UserCreated,
+            from_block=0
+        )
+
+        assert len(events) > 0
+        assert events[0]["args"]["walletAddress"] == valid_wallet_address
+
+    def test_adapter_contract_state_reading(self, blockchain_adapter, valid_wallet_address):
+        """Testa a leitura do estado do contrato."""
+        # Ler estado do contrato
+        user = blockchain_adapter._call_contract_function(
+            blockchain_adapter.contract.functions.getUser(valid_wallet_address)
+        )
+
+        assert user is not None
+        assert isinstance(user, dict)
+        assert user["walletAddress"] == valid_wallet_address
 
-def test_adapter_error_handling(blockchain_adapter):
+    def test_adapter_transaction_receipt_parsing(self, created_user):
+        """Testa o parsing de recibos de transação."""
+        # Verificar parsing do recibo
+        assert "transaction_hash" in created_user
+        assert "block_number" in created_user
+        assert "gas_used" in created_user
+        assert "status" in created_user
+
+    def test_adapter_event_parsing(self, blockchain_adapter):
+        """Testa o parsing de eventos."""
+        # Obter e verificar parsing de eventos
+        events = blockchain_adapter._get_events(
+            blockchain_adapter.contract.events.UserCreated,
+            from_block=0
+        )
+
+        assert len(events) > 0
+        event = events[0]
+        assert "event" in event
+        assert "args" in event
+        assert "blockNumber" in event
+        assert "transactionHash" in event
+
+def test_adapter_error_handling(blockchain_adapter, monkeypatch):
     """Testa o tratamento de erros."""
     # Testar erro de validação
     with pytest.raises(ValidationError):
@@ -171,7 +184,7 @@ def test_adapter_error_handling(blockchain_adapter):
     
     # Testar erro da blockchain
     with pytest.raises(BlockchainError):
-        blockchain_adapter.web3.provider = None
+        monkeypatch.setattr(blockchain_adapter.web3, "provider", None)
         blockchain_adapter.get_user("0x0000000000000000000000000000000000000000")
 
 def test_adapter_gas_estimation(blockchain_adapter, valid_wallet_address):
@@ -208,20 +221,6 @@ def test_adapter_balance_checking(blockchain_adapter, valid_wallet_address):
     assert balance >= 0
     assert isinstance(balance, int)
 
-def test_adapter_contract_state_reading(blockchain_adapter, valid_wallet_address):
-    """Testa a leitura do estado do contrato."""
-    # Criar usuário
-    blockchain_adapter.create_user(valid_wallet_address)
-    
-    # Ler estado do contrato
-    user = blockchain_adapter._call_contract_function(
-        blockchain_adapter.contract.functions.getUser(valid_wallet_address)
-    )
-    
-    assert user is not None
-    assert isinstance(user, dict)
-    assert user["walletAddress"] == valid_wallet_address
-
 def test_adapter_contract_state_writing(blockchain_adapter, valid_wallet_address):
     """Testa a escrita no estado do contrato."""
     # Criar estação
@@ -246,35 +245,6 @@ def test_adapter_contract_state_writing(blockchain_adapter, valid_wallet_address
     assert result["success"] is True
     assert "station_id" in result["data"]
 
-def test_adapter_transaction_receipt_parsing(blockchain_adapter, valid_wallet_address):
-    """Testa o parsing de recibos de transação."""
-    # Criar usuário
-    result = blockchain_adapter.create_user(valid_wallet_address)
-    
-    # Verificar parsing do recibo
-    assert "transaction_hash" in result
-    assert "block_number" in result
-    assert "gas_used" in result
-    assert "status" in result
-
-def test_adapter_event_parsing(blockchain_adapter, valid_wallet_address):
-    """Testa o parsing de eventos."""
-    # Criar usuário
-    blockchain_adapter.create_user(valid_wallet_address)
-    
-    # Obter e verificar parsing de eventos
-    events = blockchain_adapter._get_events(
-        blockchain_adapter.contract.events.UserCreated,
-        from_block=0
-    )
-    
-    assert len(events) > 0
-    event = events[0]
-    assert "event" in event
-    assert "args" in event
-    assert "blockNumber" in event
-    assert "transactionHash" in event
-
 def test_adapter_error_parsing(blockchain_adapter):
     """Testa o parsing de erros."""
     # Testar erro de validação
@@ -303,18 +273,17 @@ def test_adapter_error_parsing(blockchain_adapter):
         assert str(e) is not None
         assert "Invalid power output" in str(e)
 
-def test_adapter_retry_mechanism(blockchain_adapter, valid_wallet_address):
+def test_adapter_retry_mechanism(blockchain_adapter, valid_wallet_address, monkeypatch):
     """Testa o mecanismo de retry para transações."""
     # Simular falha temporária
-    original_provider = blockchain_adapter.web3.provider
-    blockchain_adapter.web3.provider = None
+    monkeypatch.setattr(blockchain_adapter.web3, "provider", None)
     
     try:
         # Tentar criar usuário (deve falhar)
         blockchain_adapter.create_user(valid_wallet_address)
     except BlockchainError:
         # Restaurar provider
-        blockchain_adapter.web3.provider = original_provider
+        monkeypatch.undo()
         
         # Tentar novamente (deve funcionar)
         result = blockchain_adapter.create_user(valid_wallet_address)
@@ -322,27 +291,32 @@ def test_adapter_retry_mechanism(blockchain_adapter, valid_wallet_address):
 
 def test_adapter_concurrent_transactions(blockchain_adapter, valid_wallet_address):
     """Testa o tratamento de transações concorrentes."""
-    import asyncio
+    def create_user(_):
+        try:
+            return blockchain_adapter.create_user(valid_wallet_address)
+        except Exception as e:
+            return e
     
-    async def create_user():
-        return blockchain_adapter.create_user(valid_wallet_address)
-    
-    # Criar múltiplas transações concorrentes
-    loop = asyncio.get_event_loop()
-    tasks = [create_user() for _ in range(3)]
-    
-    # Executar transações
-    results = loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    # Executar múltiplas transações concorrentes
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(create_user, range(3)))
     
     # Verificar resultados
     assert len(results) == 3
     assert all(isinstance(r, dict) for r in results if not isinstance(r, Exception))
     assert all(r["success"] is True for r in results if not isinstance(r, Exception))
 
-def test_adapter_transaction_timeout(blockchain_adapter, valid_wallet_address):
+def test_adapter_transaction_timeout(blockchain_adapter, valid_wallet_address, monkeypatch):
     """Testa o timeout de transações."""
-    # Configurar timeout curto
-    blockchain_adapter.transaction_timeout = 1
+    # Simular timeout imediato na espera pelo recibo
+    def wait_for_transaction_receipt(*args, **kwargs):
+        raise TimeExhausted("Transaction timeout")
+    
+    monkeypatch.setattr(
+        blockchain_adapter.web3.eth,
+        "wait_for_transaction_receipt",
+        wait_for_transaction_receipt
+    )
     
     # Tentar transação que deve timeout
     with pytest.raises(BlockchainError) as e:
@@ -377,36 +351,14 @@ def test_adapter_block_confirmation(blockchain_adapter, valid_wallet_address):
     
     assert confirmations >= 2
 
-def test_adapter_contract_upgrade(blockchain_adapter, web3, account):
+@pytest.mark.skip(reason="contracts/EVChargingV2.sol não existe no repositório, então não há contrato V2 para implantar")
+def test_adapter_contract_upgrade(blockchain_adapter, v2_contract_address):
     """Testa a atualização do contrato."""
-    # Compilar novo contrato
-    with open("contracts/EVChargingV2.sol", "r") as f:
-        new_contract_source = f.read()
-    
-    # Deploy do novo contrato
-    new_contract = web3.eth.contract(
-        abi=new_contract_abi,  # ABI do novo contrato
-        bytecode=new_contract_bytecode  # Bytecode do novo contrato
-    )
-    
-    # Construir transação de upgrade
-    transaction = new_contract.constructor().build_transaction({
-        "from": account.address,
-        "nonce": web3.eth.get_transaction_count(account.address),
-        "gas": 2000000,
-        "gasPrice": web3.eth.gas_price
-    })
-    
-    # Assinar e enviar transação
-    signed_txn = web3.eth.account.sign_transaction(transaction, account.key)
-    tx_hash = web3.eth.send_raw_transaction(signed_txn.rawTransaction)
-    tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
-    
     # Atualizar adaptador
-    blockchain_adapter.update_contract(tx_receipt.contractAddress)
+    blockchain_adapter.update_contract(v2_contract_address)
     
     # Verificar atualização
-    assert blockchain_adapter.contract_address == tx_receipt.contractAddress
+    assert blockchain_adapter.contract_address == v2_contract_address
     assert blockchain_adapter.contract is not None
     assert blockchain_adapter.contract.functions is not None
-    assert blockchain_adapter.contract.events is not None 
\ No newline at end of file
+    assert blockchain_adapter.contract.events is not None
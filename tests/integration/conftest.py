@@ -0,0 +1,225 @@
+import hashlib
+import json
+import os
+import shlex
+import socket
+import subprocess
+import time
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import Tuple
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from web3 import Web3
+from web3.middleware import SignAndSendRawMiddlewareBuilder
+
+from shared.constants.config import Config
+
+CONTRACTS_DIR = Path("contracts")
+# Cada worker do pytest-xdist usa seu próprio nó (gw0 -> 8545, gw1 -> 8546, ...),
+# já que o evm_revert de um worker desfaria o estado dos demais
+NODE_HOST = os.getenv("TEST_NODE_HOST", "localhost")
+NODE_BASE_PORT = int(os.getenv("TEST_NODE_PORT", "8545"))
+# Com TEST_WEB3_PROVIDER=tester a EVM roda no próprio processo (eth-tester), sem HTTP
+USE_ETH_TESTER = os.getenv("TEST_WEB3_PROVIDER", "http") == "tester"
+# Comando opcional para subir um nó por worker, com {port} substituído pela porta do worker,
+# ex.: "ganache --wallet.deterministic --server.port {port} --logging.quiet"
+NODE_COMMAND = os.getenv("TEST_NODE_COMMAND")
+NODE_STARTUP_TIMEOUT = 30
+# Mnemônico do Ganache com --wallet.deterministic: contas já financiadas pelo nó
+TEST_MNEMONIC = os.getenv(
+    "TEST_MNEMONIC",
+    "myth like bonus scare over problem client lizard pioneer submit female collect"
+)
+
+# Dados compartilhados pelos testes de integração
+STATION_DATA = MappingProxyType({
+    "location": "Test Location",
+    "power_output": 50.0,
+    "price_per_kwh": 0.5
+})
+
+# Mensagem no formato EIP-191 codificada uma única vez para assinatura
+TEST_SIGNABLE_MESSAGE = encode_defunct(text="Test message")
+
+# Início fixo das janelas de reserva, distante o bastante para estar sempre no futuro
+WINDOW_START = datetime(2030, 1, 1, 10, 0)
+
+def future_window(offset: timedelta = timedelta(0)) -> Tuple[datetime, datetime]:
+    """Retorna o início e o fim de uma janela fixa de reserva de 2 horas no futuro."""
+    start_time = WINDOW_START + offset
+    return start_time, start_time + timedelta(hours=2)
+
+def future_window_iso(offset: timedelta = timedelta(0)) -> Tuple[str, str]:
+    """Retorna a janela de future_window com início e fim em ISO."""
+    start_time, end_time = future_window(offset)
+    return start_time.isoformat(), end_time.isoformat()
+
+def _worker_index() -> int:
+    """Retorna o índice do worker do pytest-xdist (0 quando executado sem xdist)."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    return int(worker[2:]) if worker.startswith("gw") else 0
+
+def _wait_for_port(host: str, port: int, timeout: float) -> None:
+    """Aguarda até que a porta aceite conexões TCP ou o tempo limite se esgote."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+def make_pooled_session() -> requests.Session:
+    """Cria uma sessão HTTP com pool de conexões persistentes e retry para o nó local."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    ))
+    return session
+
+def _compile_contract(source_path: Path, contract_name: str) -> dict:
+    """
+    Compila um contrato com o solc e retorna seu ABI e bytecode.
+    O resultado fica em cache no disco, indexado pelo hash do código fonte.
+    """
+    digest = hashlib.sha256(source_path.read_bytes()).hexdigest()
+    cache_path = Path(tempfile.gettempdir()) / f"{contract_name.lower()}-{digest}.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_text())
+    
+    output = subprocess.run(
+        ["solc", "--optimize", "--combined-json", "abi,bin", str(source_path)],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    compiled = json.loads(output)["contracts"][f"{source_path}:{contract_name}"]
+    abi = compiled["abi"]
+    artifact = {
+        "abi": json.loads(abi) if isinstance(abi, str) else abi,
+        "bytecode": f"0x{compiled['bin']}"
+    }
+    
+    # Escrita atômica: workers do pytest-xdist podem compilar o mesmo contrato em paralelo
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(artifact))
+    os.replace(tmp_path, cache_path)
+    return artifact
+
+def deploy_contract(web3, artifact: dict) -> str:
+    """Implanta um contrato compilado com a conta padrão (ver fixture signer) e retorna seu endereço."""
+    contract = web3.eth.contract(abi=artifact["abi"], bytecode=artifact["bytecode"])
+    tx_hash = contract.constructor().transact({"gas": 2000000})
+    return web3.eth.wait_for_transaction_receipt(tx_hash, poll_latency=0.01).contractAddress
+
+def pytest_configure(config):
+    """Registra os marcadores usados pelos testes de integração."""
+    config.addinivalue_line(
+        "markers",
+        "slow: teste granular coberto por um teste composto (ignore com -m \"not slow\")"
+    )
+
+# Fixtures para conexão com o nó
+@pytest.fixture(scope="session")
+def node_url():
+    """
+    Fixture que retorna a URL do nó de desenvolvimento deste worker.
+    Com TEST_NODE_COMMAND definido, sobe um nó próprio para o worker e o encerra ao final.
+    """
+    port = NODE_BASE_PORT + _worker_index()
+    url = f"http://{NODE_HOST}:{port}"
+    if not NODE_COMMAND:
+        yield url
+        return
+    
+    process = subprocess.Popen(
+        shlex.split(NODE_COMMAND.format(port=port)),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_for_port(NODE_HOST, port, NODE_STARTUP_TIMEOUT)
+        yield url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Fixture que fornece a sessão HTTP compartilhada por todas as conexões Web3."""
+    session = make_pooled_session()
+    yield session
+    session.close()
+
+@pytest.fixture(scope="session")
+def web3(request):
+    """
+    Fixture que cria uma instância do Web3 para testes.
+    Usa o eth-tester em processo quando habilitado; caso contrário, conecta ao nó
+    local reaproveitando as conexões HTTP.
+    """
+    if USE_ETH_TESTER:
+        return Web3(Web3.EthereumTesterProvider())
+    return Web3(Web3.HTTPProvider(
+        request.getfixturevalue("node_url"),
+        session=request.getfixturevalue("http_session")
+    ))
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_receipt_polling():
+    """
+    Fixture que reduz o intervalo de consulta de recibos do adaptador.
+    O nó de desenvolvimento minera na hora, então o intervalo padrão só adiciona espera.
+    """
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Config, "WEB3_POLL_LATENCY", 0.01)
+        yield
+
+@pytest.fixture
+def chain_snapshot(web3):
+    """Fixture que isola o estado da blockchain entre os testes via evm_snapshot/evm_revert."""
+    snapshot_id = web3.provider.make_request("evm_snapshot", [])["result"]
+    yield
+    web3.provider.make_request("evm_revert", [snapshot_id])
+
+@pytest.fixture(scope="session")
+def account():
+    """
+    Fixture que retorna uma conta pré-financiada do nó de desenvolvimento.
+    Cada worker do pytest-xdist usa uma conta diferente, evitando disputa de nonce.
+    """
+    if USE_ETH_TESTER:
+        # Primeira conta padrão do eth-tester (chave privada 1), já financiada
+        return Account.from_key((1).to_bytes(32, "big"))
+    
+    Account.enable_unaudited_hdwallet_features()
+    return Account.from_mnemonic(TEST_MNEMONIC, account_path=f"m/44'/60'/0'/0/{_worker_index()}")
+
+@pytest.fixture(scope="session")
+def signer(web3, account):
+    """
+    Fixture que registra a conta de testes como assinante local do web3.
+    Transações enviadas com transact() a partir dela são preenchidas, assinadas
+    e enviadas pelo middleware, sem montar e assinar cada transação à mão.
+    """
+    web3.middleware_onion.inject(SignAndSendRawMiddlewareBuilder.build(account), name="signer", layer=0)
+    web3.eth.default_account = account.address
+    return account
+
+# Fixtures para contratos compilados
+@pytest.fixture(scope="session")
+def compiled_contract():
+    """Fixture que retorna o ABI e o bytecode do contrato EVCharging."""
+    return _compile_contract(CONTRACTS_DIR / "EVCharging.sol", "EVCharging")
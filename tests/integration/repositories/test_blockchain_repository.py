@@ -1,83 +1,67 @@
 import pytest
-from datetime import datetime, timedelta
-from decimal import Decimal
-from web3 import Web3
+from datetime import timedelta
 from eth_account import Account
-from eth_utils import to_checksum_address
 
 from adapters.blockchain.blockchain_adapter import BlockchainAdapter
 from repositories.blockchain_repository import BlockchainRepository
-from domain.entities.session import SessionStatus
+from domain.entities.session import Session, SessionStatus
 from domain.entities.station import Station
 from domain.entities.user import User
 from domain.entities.reservation import Reservation
 from domain.exceptions.custom_exceptions import (
     ValidationError,
     ResourceNotFoundError,
-    ResourceConflictError,
-    BlockchainError
+    ResourceConflictError
 )
 
-@pytest.fixture
-def web3():
-    """Fixture que cria uma instância do Web3 para testes."""
-    return Web3(Web3.HTTPProvider("http://localhost:8545"))
+from tests.integration.conftest import STATION_DATA, TEST_SIGNABLE_MESSAGE, deploy_contract, future_window
 
-@pytest.fixture
-def account():
-    """Fixture que cria uma conta Ethereum para testes."""
-    return Account.create()
+pytestmark = pytest.mark.usefixtures("chain_snapshot")
 
-@pytest.fixture
-def contract_address(web3, account):
-    """Fixture que implanta o contrato e retorna seu endereço."""
-    # Compilar o contrato
-    with open("contracts/EVCharging.sol", "r") as f:
-        contract_source = f.read()
-    
-    # Deploy do contrato
-    contract = web3.eth.contract(
-        abi=contract_abi,  # ABI do contrato
-        bytecode=contract_bytecode  # Bytecode do contrato
-    )
-    
-    # Construir transação
-    transaction = contract.constructor().build_transaction({
-        "from": account.address,
-        "nonce": web3.eth.get_transaction_count(account.address),
-        "gas": 2000000,
-        "gasPrice": web3.eth.gas_price
-    })
-    
-    # Assinar e enviar transação
-    signed_txn = web3.eth.account.sign_transaction(transaction, account.key)
-    tx_hash = web3.eth.send_raw_transaction(signed_txn.rawTransaction)
-    tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
-    
-    return tx_receipt.contractAddress
+@pytest.fixture(scope="session")
+def contract_address(web3, signer, compiled_contract):
+    """Fixture que implanta o contrato uma única vez e retorna seu endereço."""
+    return deploy_contract(web3, compiled_contract)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blockchain_adapter(web3, contract_address):
-    """Fixture que cria uma instância do adaptador blockchain para testes."""
+    """Fixture que cria uma única instância do adaptador blockchain para os testes."""
     return BlockchainAdapter(web3, contract_address)
 
 @pytest.fixture
 def blockchain_repository(blockchain_adapter):
-    """Fixture que cria uma instância do repositório blockchain para testes."""
+    """
+    Fixture que cria uma instância do repositório blockchain para testes.
+    O repositório é recriado a cada teste para não carregar estado em memória entre eles.
+    """
     return BlockchainRepository(blockchain_adapter)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_wallet_address(account):
-    """Fixture que retorna um endereço de carteira válido para testes."""
-    return to_checksum_address(account.address)
+    """Fixture que retorna um endereço de carteira válido para testes (já em formato checksum)."""
+    return account.address
+
+@pytest.fixture(scope="session")
+def valid_signature(account):
+    """Fixture que retorna uma assinatura válida para testes, calculada uma única vez."""
+    return Account.sign_message(TEST_SIGNABLE_MESSAGE, account.key).signature.hex()
+
+@pytest.fixture
+def prepared_station(blockchain_repository, valid_wallet_address):
+    """Fixture que cria uma estação para o teste."""
+    return blockchain_repository.create_station({
+        **STATION_DATA,
+        "owner_address": valid_wallet_address
+    })
 
 @pytest.fixture
-def valid_signature(web3, account):
-    """Fixture que retorna uma assinatura válida para testes."""
-    message = "Test message"
-    message_hash = web3.keccak(text=message)
-    signed_message = web3.eth.account.sign_message(message_hash, account.key)
-    return signed_message.signature.hex()
+def active_session(blockchain_repository, prepared_station, valid_wallet_address, valid_signature):
+    """Fixture que inicia uma sessão na estação do teste."""
+    return blockchain_repository.start_session(
+        prepared_station.id,
+        valid_wallet_address,
+        valid_signature
+    )
 
 def test_create_user(blockchain_repository, valid_wallet_address):
     """Testa a criação de um usuário."""
@@ -105,12 +89,7 @@ def test_get_user(blockchain_repository, valid_wallet_address):
 
 def test_create_station(blockchain_repository, valid_wallet_address):
     """Testa a criação de uma estação."""
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
+    station_data = {**STATION_DATA, "owner_address": valid_wallet_address}
     
     station = blockchain_repository.create_station(station_data)
     
@@ -122,48 +101,30 @@ def test_create_station(blockchain_repository, valid_wallet_address):
     assert station.is_available is True
     assert station.total_revenue == 0
 
-def test_get_station(blockchain_repository, valid_wallet_address):
+def test_get_station(blockchain_repository, prepared_station, valid_wallet_address):
     """Testa a obtenção de uma estação."""
-    # Criar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    created_station = blockchain_repository.create_station(station_data)
-    
     # Obter estação
-    station = blockchain_repository.get_station(created_station.id)
+    station = blockchain_repository.get_station(prepared_station.id)
     
     assert isinstance(station, Station)
-    assert station.id == created_station.id
-    assert station.location == station_data["location"]
-    assert station.power_output == station_data["power_output"]
-    assert station.price_per_kwh == station_data["price_per_kwh"]
-    assert station.owner_address == station_data["owner_address"]
+    assert station.id == prepared_station.id
+    assert station.location == STATION_DATA["location"]
+    assert station.power_output == STATION_DATA["power_output"]
+    assert station.price_per_kwh == STATION_DATA["price_per_kwh"]
+    assert station.owner_address == valid_wallet_address
     assert station.is_available is True
     assert station.total_revenue == 0
 
-def test_start_session(blockchain_repository, valid_wallet_address, valid_signature):
+def test_start_session(blockchain_repository, prepared_station, valid_wallet_address, valid_signature):
     """Testa o início de uma sessão."""
-    # Criar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
     # Iniciar sessão
     session = blockchain_repository.start_session(
-        station.id,
+        prepared_station.id,
         valid_wallet_address,
         valid_signature
     )
     
-    assert session.station_id == station.id
+    assert session.station_id == prepared_station.id
     assert session.wallet_address == valid_wallet_address
     assert session.status == SessionStatus.ACTIVE
     assert session.start_time is not None
@@ -171,81 +132,41 @@ def test_start_session(blockchain_repository, valid_wallet_address, valid_signat
     assert session.payment_amount is None
     assert session.payment_time is None
 
-def test_end_session(blockchain_repository, valid_wallet_address, valid_signature):
+def test_end_session(blockchain_repository, active_session):
     """Testa o fim de uma sessão."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
-    session = blockchain_repository.start_session(
-        station.id,
-        valid_wallet_address,
-        valid_signature
-    )
-    
     # Finalizar sessão
-    ended_session = blockchain_repository.end_session(session.id)
+    ended_session = blockchain_repository.end_session(active_session.id)
     
-    assert ended_session.id == session.id
+    assert ended_session.id == active_session.id
     assert ended_session.status == SessionStatus.COMPLETED
     assert ended_session.end_time is not None
     assert ended_session.payment_amount is None
     assert ended_session.payment_time is None
 
-def test_process_payment(blockchain_repository, valid_wallet_address, valid_signature):
+def test_process_payment(blockchain_repository, active_session, valid_wallet_address, valid_signature):
     """Testa o processamento de um pagamento."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
-    session = blockchain_repository.start_session(
-        station.id,
-        valid_wallet_address,
-        valid_signature
-    )
-    
     # Finalizar sessão
-    blockchain_repository.end_session(session.id)
+    blockchain_repository.end_session(active_session.id)
     
     # Processar pagamento
     paid_session = blockchain_repository.process_payment(
-        session.id,
+        active_session.id,
         valid_wallet_address,
         valid_signature
     )
     
-    assert paid_session.id == session.id
+    assert paid_session.id == active_session.id
     assert paid_session.status == SessionStatus.PAID
     assert paid_session.payment_amount is not None
     assert paid_session.payment_time is not None
 
-def test_create_reservation(blockchain_repository, valid_wallet_address, valid_signature):
+def test_create_reservation(blockchain_repository, prepared_station, valid_wallet_address, valid_signature):
     """Testa a criação de uma reserva."""
-    # Criar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
     # Criar reserva
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    start_time, end_time = future_window()
     
     reservation = blockchain_repository.create_reservation(
-        station.id,
+        prepared_station.id,
         valid_wallet_address,
         start_time,
         end_time,
@@ -253,28 +174,19 @@ def test_create_reservation(blockchain_repository, valid_wallet_address, valid_s
     )
     
     assert isinstance(reservation, Reservation)
-    assert reservation.station_id == station.id
+    assert reservation.station_id == prepared_station.id
     assert reservation.wallet_address == valid_wallet_address
     assert reservation.start_time == start_time
     assert reservation.end_time == end_time
     assert reservation.status == "active"
 
-def test_cancel_reservation(blockchain_repository, valid_wallet_address, valid_signature):
+def test_cancel_reservation(blockchain_repository, prepared_station, valid_wallet_address, valid_signature):
     """Testa o cancelamento de uma reserva."""
-    # Criar estação e reserva
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    # Criar reserva
+    start_time, end_time = future_window()
     
     reservation = blockchain_repository.create_reservation(
-        station.id,
+        prepared_station.id,
         valid_wallet_address,
         start_time,
         end_time,
@@ -291,23 +203,8 @@ def test_cancel_reservation(blockchain_repository, valid_wallet_address, valid_s
     assert cancelled_reservation.id == reservation.id
     assert cancelled_reservation.status == "cancelled"
 
-def test_get_user_sessions(blockchain_repository, valid_wallet_address, valid_signature):
+def test_get_user_sessions(blockchain_repository, active_session, valid_wallet_address):
     """Testa a obtenção das sessões de um usuário."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
-    blockchain_repository.start_session(
-        station.id,
-        valid_wallet_address,
-        valid_signature
-    )
-    
     # Obter sessões do usuário
     sessions = blockchain_repository.get_user_sessions(valid_wallet_address)
     
@@ -316,47 +213,23 @@ def test_get_user_sessions(blockchain_repository, valid_wallet_address, valid_si
     assert all(isinstance(session, Session) for session in sessions)
     assert all(session.wallet_address == valid_wallet_address for session in sessions)
 
-def test_get_station_sessions(blockchain_repository, valid_wallet_address, valid_signature):
+def test_get_station_sessions(blockchain_repository, active_session, prepared_station):
     """Testa a obtenção das sessões de uma estação."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
-    blockchain_repository.start_session(
-        station.id,
-        valid_wallet_address,
-        valid_signature
-    )
-    
     # Obter sessões da estação
-    sessions = blockchain_repository.get_station_sessions(station.id)
+    sessions = blockchain_repository.get_station_sessions(prepared_station.id)
     
     assert isinstance(sessions, list)
     assert len(sessions) > 0
     assert all(isinstance(session, Session) for session in sessions)
-    assert all(session.station_id == station.id for session in sessions)
+    assert all(session.station_id == prepared_station.id for session in sessions)
 
-def test_get_user_reservations(blockchain_repository, valid_wallet_address, valid_signature):
+def test_get_user_reservations(blockchain_repository, prepared_station, valid_wallet_address, valid_signature):
     """Testa a obtenção das reservas de um usuário."""
-    # Criar estação e reserva
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    # Criar reserva
+    start_time, end_time = future_window()
     
     blockchain_repository.create_reservation(
-        station.id,
+        prepared_station.id,
         valid_wallet_address,
         start_time,
         end_time,
@@ -371,22 +244,13 @@ def test_get_user_reservations(blockchain_repository, valid_wallet_address, vali
     assert all(isinstance(reservation, Reservation) for reservation in reservations)
     assert all(reservation.wallet_address == valid_wallet_address for reservation in reservations)
 
-def test_get_station_reservations(blockchain_repository, valid_wallet_address, valid_signature):
+def test_get_station_reservations(blockchain_repository, prepared_station, valid_wallet_address, valid_signature):
     """Testa a obtenção das reservas de uma estação."""
-    # Criar estação e reserva
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    # Criar reserva
+    start_time, end_time = future_window()
     
     blockchain_repository.create_reservation(
-        station.id,
+        prepared_station.id,
         valid_wallet_address,
         start_time,
         end_time,
@@ -394,109 +258,51 @@ def test_get_station_reservations(blockchain_repository, valid_wallet_address, v
     )
     
     # Obter reservas da estação
-    reservations = blockchain_repository.get_station_reservations(station.id)
+    reservations = blockchain_repository.get_station_reservations(prepared_station.id)
     
     assert isinstance(reservations, list)
     assert len(reservations) > 0
     assert all(isinstance(reservation, Reservation) for reservation in reservations)
-    assert all(reservation.station_id == station.id for reservation in reservations)
-
-def test_invalid_wallet_address(blockchain_repository):
-    """Testa operações com endereço de carteira inválido."""
-    invalid_wallet = "0x0000000000000000000000000000000000000000"
-    
-    with pytest.raises(ValidationError):
-        blockchain_repository.create_user(invalid_wallet)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.get_user(invalid_wallet)
-
-def test_invalid_station_id(blockchain_repository):
-    """Testa operações com ID de estação inválido."""
-    invalid_station_id = 999
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.get_station(invalid_station_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.get_station_sessions(invalid_station_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.get_station_reservations(invalid_station_id)
+    assert all(reservation.station_id == prepared_station.id for reservation in reservations)
 
-def test_invalid_session_id(blockchain_repository):
-    """Testa operações com ID de sessão inválido."""
-    invalid_session_id = 999
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.get_session(invalid_session_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.end_session(invalid_session_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.process_payment(
-            invalid_session_id,
-            "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
-            "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1b"
-        )
+INVALID_WALLET = "0x0000000000000000000000000000000000000000"
+OTHER_WALLET = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+OTHER_SIGNATURE = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1b"
 
-def test_invalid_reservation_id(blockchain_repository):
-    """Testa operações com ID de reserva inválido."""
-    invalid_reservation_id = 999
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.get_reservation(invalid_reservation_id)
-    
-    with pytest.raises(ResourceNotFoundError):
-        blockchain_repository.cancel_reservation(
-            invalid_reservation_id,
-            "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
-            "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1b"
-        )
+@pytest.mark.parametrize("method_name,bad_args,exc", [
+    ("create_user", (INVALID_WALLET,), ValidationError),
+    ("get_user", (INVALID_WALLET,), ResourceNotFoundError),
+    ("get_station", (999,), ResourceNotFoundError),
+    ("get_station_sessions", (999,), ResourceNotFoundError),
+    ("get_station_reservations", (999,), ResourceNotFoundError),
+    ("get_session", (999,), ResourceNotFoundError),
+    ("end_session", (999,), ResourceNotFoundError),
+    ("process_payment", (999, OTHER_WALLET, OTHER_SIGNATURE), ResourceNotFoundError),
+    ("get_reservation", (999,), ResourceNotFoundError),
+    ("cancel_reservation", (999, OTHER_WALLET, OTHER_SIGNATURE), ResourceNotFoundError),
+])
+def test_invalid_ids(blockchain_repository, method_name, bad_args, exc):
+    """Testa operações com carteira, estação, sessão ou reserva inválidas."""
+    with pytest.raises(exc):
+        getattr(blockchain_repository, method_name)(*bad_args)
 
-def test_station_busy(blockchain_repository, valid_wallet_address, valid_signature):
+def test_station_busy(blockchain_repository, active_session, prepared_station, valid_wallet_address, valid_signature):
     """Testa operações em estação ocupada."""
-    # Criar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
-    blockchain_repository.start_session(
-        station.id,
-        valid_wallet_address,
-        valid_signature
-    )
-    
     # Tentar iniciar outra sessão
     with pytest.raises(ResourceConflictError):
         blockchain_repository.start_session(
-            station.id,
+            prepared_station.id,
             valid_wallet_address,
             valid_signature
         )
 
-def test_reservation_overlap(blockchain_repository, valid_wallet_address, valid_signature):
+def test_reservation_overlap(blockchain_repository, prepared_station, valid_wallet_address, valid_signature):
     """Testa criação de reservas com sobreposição de horário."""
-    # Criar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_repository.create_station(station_data)
-    
     # Criar primeira reserva
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    start_time, end_time = future_window()
     
     blockchain_repository.create_reservation(
-        station.id,
+        prepared_station.id,
         valid_wallet_address,
         start_time,
         end_time,
@@ -506,29 +312,8 @@ def test_reservation_overlap(blockchain_repository, valid_wallet_address, valid_
     # Tentar criar reserva com sobreposição
     with pytest.raises(ResourceConflictError):
         blockchain_repository.create_reservation(
-            station.id,
+            prepared_station.id,
             valid_wallet_address,
-            start_time + timedelta(minutes=30),
-            end_time + timedelta(minutes=30),
+            *future_window(offset=timedelta(minutes=30)),
             valid_signature
         )
-
-def test_blockchain_error(blockchain_repository, web3):
-    """Testa o tratamento de erro da blockchain."""
-    # Desconectar o Web3 para simular erro
-    web3.provider = None
-    
-    with pytest.raises(BlockchainError):
-        blockchain_repository.create_user("0x742d35Cc6634C0532925a3b844Bc454e4438f44e")
-    
-    with pytest.raises(BlockchainError):
-        blockchain_repository.get_user("0x742d35Cc6634C0532925a3b844Bc454e4438f44e")
-    
-    with pytest.raises(BlockchainError):
-        blockchain_repository.get_station(1)
-    
-    with pytest.raises(BlockchainError):
-        blockchain_repository.get_session(1)
-    
-    with pytest.raises(BlockchainError):
-        blockchain_repository.get_reservation(1) 
\ No newline at end of file
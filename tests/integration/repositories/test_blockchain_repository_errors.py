@@ -0,0 +1,42 @@
+import pytest
+from web3 import Web3
+
+from adapters.blockchain.blockchain_adapter import BlockchainAdapter
+from repositories.blockchain_repository import BlockchainRepository
+from domain.exceptions.custom_exceptions import BlockchainError
+
+WALLET_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+# Nenhuma chamada chega ao nó, então o contrato não precisa estar implantado
+CONTRACT_ADDRESS = "0x0000000000000000000000000000000000000001"
+
+@pytest.fixture
+def web3():
+    """
+    Fixture que cria uma instância do Web3 desconectada, exclusiva do teste.
+    Sobrepõe a fixture de sessão para não afetar os demais testes de integração.
+    """
+    web3 = Web3(Web3.HTTPProvider("http://localhost:8545"))
+    web3.provider = None
+    return web3
+
+@pytest.fixture
+def blockchain_repository(web3):
+    """Fixture que cria um repositório blockchain sobre o Web3 desconectado."""
+    return BlockchainRepository(BlockchainAdapter(web3, CONTRACT_ADDRESS))
+
+def test_blockchain_error(blockchain_repository):
+    """Testa o tratamento de erro da blockchain."""
+    with pytest.raises(BlockchainError):
+        blockchain_repository.create_user(WALLET_ADDRESS)
+    
+    with pytest.raises(BlockchainError):
+        blockchain_repository.get_user(WALLET_ADDRESS)
+    
+    with pytest.raises(BlockchainError):
+        blockchain_repository.get_station(1)
+    
+    with pytest.raises(BlockchainError):
+        blockchain_repository.get_session(1)
+    
+    with pytest.raises(BlockchainError):
+        blockchain_repository.get_reservation(1)
@@ -1,9 +1,8 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from decimal import Decimal
 from web3 import Web3
 from eth_account import Account
-from eth_utils import to_checksum_address
 
 from adapters.blockchain.blockchain_adapter import BlockchainAdapter
 from repositories.blockchain_repository import BlockchainRepository
@@ -19,71 +18,47 @@ from domain.exceptions.custom_exceptions import (
     BlockchainError
 )
 
-@pytest.fixture
-def web3():
-    """Fixture que cria uma instância do Web3 para testes."""
-    return Web3(Web3.HTTPProvider("http://localhost:8545"))
+from tests.integration.conftest import STATION_DATA, TEST_SIGNABLE_MESSAGE, deploy_contract, future_window
 
-@pytest.fixture
-def account():
-    """Fixture que cria uma conta Ethereum para testes."""
-    return Account.create()
+pytestmark = pytest.mark.usefixtures("chain_snapshot")
 
-@pytest.fixture
-def contract_address(web3, account):
-    """Fixture que implanta o contrato e retorna seu endereço."""
-    # Compilar o contrato
-    with open("contracts/EVCharging.sol", "r") as f:
-        contract_source = f.read()
-    
-    # Deploy do contrato
-    contract = web3.eth.contract(
-        abi=contract_abi,  # ABI do contrato
-        bytecode=contract_bytecode  # Bytecode do contrato
-    )
-    
-    # Construir transação
-    transaction = contract.constructor().build_transaction({
-        "from": account.address,
-        "nonce": web3.eth.get_transaction_count(account.address),
-        "gas": 2000000,
-        "gasPrice": web3.eth.gas_price
-    })
-    
-    # Assinar e enviar transação
-    signed_txn = web3.eth.account.sign_transaction(transaction, account.key)
-    tx_hash = web3.eth.send_raw_transaction(signed_txn.rawTransaction)
-    tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
-    
-    return tx_receipt.contractAddress
+@pytest.fixture(scope="session")
+def contract_address(web3, signer, compiled_contract):
+    """Fixture que implanta o contrato uma única vez e retorna seu endereço."""
+    return deploy_contract(web3, compiled_contract)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blockchain_adapter(web3, contract_address):
-    """Fixture que cria uma instância do adaptador blockchain para testes."""
+    """Fixture que cria uma única instância do adaptador blockchain para os testes."""
     return BlockchainAdapter(web3, contract_address)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blockchain_repository(blockchain_adapter):
-    """Fixture que cria uma instância do repositório blockchain para testes."""
+    """Fixture que cria uma única instância do repositório blockchain para os testes."""
     return BlockchainRepository(blockchain_adapter)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blockchain_service(blockchain_repository):
-    """Fixture que cria uma instância do serviço blockchain para testes."""
+    """Fixture que cria uma única instância do serviço blockchain para os testes."""
     return BlockchainService(blockchain_repository)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_wallet_address(account):
-    """Fixture que retorna um endereço de carteira válido para testes."""
-    return to_checksum_address(account.address)
+    """Fixture que retorna um endereço de carteira válido para testes (já em formato checksum)."""
+    return account.address
+
+@pytest.fixture(scope="session")
+def valid_signature(account):
+    """Fixture que retorna uma assinatura válida para testes, calculada uma única vez."""
+    return Account.sign_message(TEST_SIGNABLE_MESSAGE, account.key).signature.hex()
 
-@pytest.fixture
-def valid_signature(web3, account):
-    """Fixture que retorna uma assinatura válida para testes."""
-    message = "Test message"
-    message_hash = web3.keccak(text=message)
-    signed_message = web3.eth.account.sign_message(message_hash, account.key)
-    return signed_message.signature.hex()
+@pytest.fixture(scope="module")
+def shared_station(blockchain_service, valid_wallet_address):
+    """
+    Fixture que registra uma estação compartilhada pelos testes do módulo.
+    A estação é registrada antes do snapshot de cada teste, então volta disponível após o revert.
+    """
+    return blockchain_service.register_station({**STATION_DATA, "owner_address": valid_wallet_address})
 
 def test_register_user(blockchain_service, valid_wallet_address):
     """Testa o registro de um usuário."""
@@ -114,12 +89,7 @@ def test_get_user_profile(blockchain_service, valid_wallet_address):
 
 def test_register_station(blockchain_service, valid_wallet_address):
     """Testa o registro de uma estação."""
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
+    station_data = {**STATION_DATA, "owner_address": valid_wallet_address}
     
     station = blockchain_service.register_station(station_data)
     
@@ -131,26 +101,17 @@ def test_register_station(blockchain_service, valid_wallet_address):
     assert station.is_available is True
     assert station.total_revenue == 0
 
-def test_get_station_details(blockchain_service, valid_wallet_address):
+def test_get_station_details(blockchain_service, shared_station, valid_wallet_address):
     """Testa a obtenção dos detalhes de uma estação."""
-    # Registrar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    registered_station = blockchain_service.register_station(station_data)
-    
     # Obter detalhes
-    details = blockchain_service.get_station_details(registered_station.id)
+    details = blockchain_service.get_station_details(shared_station.id)
     
     assert isinstance(details, dict)
-    assert details["id"] == registered_station.id
-    assert details["location"] == station_data["location"]
-    assert details["power_output"] == station_data["power_output"]
-    assert details["price_per_kwh"] == station_data["price_per_kwh"]
-    assert details["owner_address"] == station_data["owner_address"]
+    assert details["id"] == shared_station.id
+    assert details["location"] == STATION_DATA["location"]
+    assert details["power_output"] == STATION_DATA["power_output"]
+    assert details["price_per_kwh"] == STATION_DATA["price_per_kwh"]
+    assert details["owner_address"] == valid_wallet_address
     assert details["is_available"] is True
     assert details["total_revenue"] == 0
     assert "current_session" in details
@@ -158,25 +119,17 @@ def test_get_station_details(blockchain_service, valid_wallet_address):
     assert "rating" in details
     assert "total_sessions" in details
 
-def test_start_charging_session(blockchain_service, valid_wallet_address, valid_signature):
+@pytest.mark.slow
+def test_start_charging_session(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa o início de uma sessão de carregamento."""
-    # Registrar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
     # Iniciar sessão
     session = blockchain_service.start_charging_session(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         valid_signature
     )
     
-    assert session.station_id == station.id
+    assert session.station_id == shared_station.id
     assert session.wallet_address == valid_wallet_address
     assert session.status == SessionStatus.ACTIVE
     assert session.start_time is not None
@@ -184,19 +137,12 @@ def test_start_charging_session(blockchain_service, valid_wallet_address, valid_
     assert session.payment_amount is None
     assert session.payment_time is None
 
-def test_end_charging_session(blockchain_service, valid_wallet_address, valid_signature):
+@pytest.mark.slow
+def test_end_charging_session(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa o fim de uma sessão de carregamento."""
-    # Registrar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
+    # Iniciar sessão
     session = blockchain_service.start_charging_session(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         valid_signature
     )
@@ -213,19 +159,12 @@ def test_end_charging_session(blockchain_service, valid_wallet_address, valid_si
     assert "energy_consumed" in ended_session.__dict__
     assert "estimated_cost" in ended_session.__dict__
 
-def test_process_session_payment(blockchain_service, valid_wallet_address, valid_signature):
+@pytest.mark.slow
+def test_process_session_payment(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa o processamento do pagamento de uma sessão."""
-    # Registrar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
+    # Iniciar sessão
     session = blockchain_service.start_charging_session(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         valid_signature
     )
@@ -248,23 +187,13 @@ def test_process_session_payment(blockchain_service, valid_wallet_address, valid
     assert "transaction_hash" in payment
     assert "block_number" in payment
 
-def test_create_charging_reservation(blockchain_service, valid_wallet_address, valid_signature):
+def test_create_charging_reservation(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa a criação de uma reserva de carregamento."""
-    # Registrar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
     # Criar reserva
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    start_time, end_time = future_window()
     
     reservation = blockchain_service.create_charging_reservation(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         start_time,
         end_time,
@@ -272,28 +201,19 @@ def test_create_charging_reservation(blockchain_service, valid_wallet_address, v
     )
     
     assert isinstance(reservation, Reservation)
-    assert reservation.station_id == station.id
+    assert reservation.station_id == shared_station.id
     assert reservation.wallet_address == valid_wallet_address
     assert reservation.start_time == start_time
     assert reservation.end_time == end_time
     assert reservation.status == "active"
 
-def test_cancel_charging_reservation(blockchain_service, valid_wallet_address, valid_signature):
+def test_cancel_charging_reservation(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa o cancelamento de uma reserva de carregamento."""
-    # Registrar estação e criar reserva
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    # Criar reserva
+    start_time, end_time = future_window()
     
     reservation = blockchain_service.create_charging_reservation(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         start_time,
         end_time,
@@ -310,19 +230,12 @@ def test_cancel_charging_reservation(blockchain_service, valid_wallet_address, v
     assert cancelled_reservation.id == reservation.id
     assert cancelled_reservation.status == "cancelled"
 
-def test_get_user_charging_history(blockchain_service, valid_wallet_address, valid_signature):
+@pytest.mark.slow
+def test_get_user_charging_history(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa a obtenção do histórico de carregamento de um usuário."""
-    # Registrar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
+    # Iniciar sessão
     session = blockchain_service.start_charging_session(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         valid_signature
     )
@@ -337,62 +250,40 @@ def test_get_user_charging_history(blockchain_service, valid_wallet_address, val
     assert "reservations" in history
     assert "statistics" in history
     assert len(history["sessions"]) > 0
-    assert all(isinstance(session, dict) for session in history["sessions"])
-    assert all("session_id" in session for session in history["sessions"])
-    assert all("station_id" in session for session in history["sessions"])
-    assert all("status" in session for session in history["sessions"])
-    assert all("start_time" in session for session in history["sessions"])
-    assert all("end_time" in session for session in history["sessions"])
-    assert all("energy_consumed" in session for session in history["sessions"])
-    assert all("cost" in session for session in history["sessions"])
+    required_keys = frozenset({"session_id", "station_id", "status", "start_time", "end_time", "energy_consumed", "cost"})
+    for session in history["sessions"]:
+        assert isinstance(session, dict)
+        assert required_keys <= session.keys()
 
-def test_get_station_charging_history(blockchain_service, valid_wallet_address, valid_signature):
+@pytest.mark.slow
+def test_get_station_charging_history(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa a obtenção do histórico de carregamento de uma estação."""
-    # Registrar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
+    # Iniciar sessão
     blockchain_service.start_charging_session(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         valid_signature
     )
     
     # Obter histórico
-    history = blockchain_service.get_station_charging_history(station.id)
+    history = blockchain_service.get_station_charging_history(shared_station.id)
     
     assert isinstance(history, dict)
     assert "sessions" in history
     assert "reservations" in history
     assert "statistics" in history
     assert len(history["sessions"]) > 0
-    assert all(isinstance(session, dict) for session in history["sessions"])
-    assert all("session_id" in session for session in history["sessions"])
-    assert all("wallet_address" in session for session in history["sessions"])
-    assert all("status" in session for session in history["sessions"])
-    assert all("start_time" in session for session in history["sessions"])
-    assert all("end_time" in session for session in history["sessions"])
-    assert all("energy_consumed" in session for session in history["sessions"])
-    assert all("revenue" in session for session in history["sessions"])
+    required_keys = frozenset({"session_id", "wallet_address", "status", "start_time", "end_time", "energy_consumed", "revenue"})
+    for session in history["sessions"]:
+        assert isinstance(session, dict)
+        assert required_keys <= session.keys()
 
-def test_get_user_payment_history(blockchain_service, valid_wallet_address, valid_signature):
+@pytest.mark.slow
+def test_get_user_payment_history(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa a obtenção do histórico de pagamentos de um usuário."""
-    # Registrar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
+    # Iniciar sessão
     session = blockchain_service.start_charging_session(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         valid_signature
     )
@@ -410,26 +301,17 @@ def test_get_user_payment_history(blockchain_service, valid_wallet_address, vali
     
     assert isinstance(history, list)
     assert len(history) > 0
-    assert all(isinstance(payment, dict) for payment in history)
-    assert all("session_id" in payment for payment in history)
-    assert all("amount" in payment for payment in history)
-    assert all("timestamp" in payment for payment in history)
-    assert all("transaction_hash" in payment for payment in history)
-    assert all("status" in payment for payment in history)
+    required_keys = frozenset({"session_id", "amount", "timestamp", "transaction_hash", "status"})
+    for payment in history:
+        assert isinstance(payment, dict)
+        assert required_keys <= payment.keys()
 
-def test_get_station_revenue_history(blockchain_service, valid_wallet_address, valid_signature):
+@pytest.mark.slow
+def test_get_station_revenue_history(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa a obtenção do histórico de receita de uma estação."""
-    # Registrar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
+    # Iniciar sessão
     session = blockchain_service.start_charging_session(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         valid_signature
     )
@@ -443,18 +325,110 @@ def test_get_station_revenue_history(blockchain_service, valid_wallet_address, v
     )
     
     # Obter histórico
-    history = blockchain_service.get_station_revenue_history(station.id)
+    history = blockchain_service.get_station_revenue_history(shared_station.id)
     
     assert isinstance(history, dict)
     assert "payments" in history
     assert "statistics" in history
     assert len(history["payments"]) > 0
-    assert all(isinstance(payment, dict) for payment in history["payments"])
-    assert all("session_id" in payment for payment in history["payments"])
-    assert all("amount" in payment for payment in history["payments"])
-    assert all("timestamp" in payment for payment in history["payments"])
-    assert all("transaction_hash" in payment for payment in history["payments"])
-    assert all("wallet_address" in payment for payment in history["payments"])
+    required_keys = frozenset({"session_id", "amount", "timestamp", "transaction_hash", "wallet_address"})
+    for payment in history["payments"]:
+        assert isinstance(payment, dict)
+        assert required_keys <= payment.keys()
+
+def test_full_lifecycle(blockchain_service, shared_station, valid_wallet_address, valid_signature):
+    """
+    Testa o ciclo completo de uma sessão (início, fim, pagamento e históricos) em um único fluxo.
+    Cobre as verificações dos testes individuais marcados como slow com uma única sequência de transações.
+    """
+    # Iniciar sessão
+    session = blockchain_service.start_charging_session(
+        shared_station.id,
+        valid_wallet_address,
+        valid_signature
+    )
+    
+    assert session.station_id == shared_station.id
+    assert session.wallet_address == valid_wallet_address
+    assert session.status == SessionStatus.ACTIVE
+    assert session.start_time is not None
+    assert session.end_time is None
+    assert session.payment_amount is None
+    assert session.payment_time is None
+    
+    # Histórico da estação com a sessão em andamento
+    station_history = blockchain_service.get_station_charging_history(shared_station.id)
+    
+    assert isinstance(station_history, dict)
+    assert "sessions" in station_history
+    assert "reservations" in station_history
+    assert "statistics" in station_history
+    assert len(station_history["sessions"]) > 0
+    required_keys = frozenset({"session_id", "wallet_address", "status", "start_time", "end_time", "energy_consumed", "revenue"})
+    for station_session in station_history["sessions"]:
+        assert isinstance(station_session, dict)
+        assert required_keys <= station_session.keys()
+    
+    # Finalizar sessão
+    ended_session = blockchain_service.end_charging_session(session.id)
+    
+    assert ended_session.id == session.id
+    assert ended_session.status == SessionStatus.COMPLETED
+    assert ended_session.end_time is not None
+    assert ended_session.payment_amount is None
+    assert ended_session.payment_time is None
+    assert "duration" in ended_session.__dict__
+    assert "energy_consumed" in ended_session.__dict__
+    assert "estimated_cost" in ended_session.__dict__
+    
+    # Histórico do usuário com a sessão finalizada
+    user_history = blockchain_service.get_user_charging_history(valid_wallet_address)
+    
+    assert isinstance(user_history, dict)
+    assert "sessions" in user_history
+    assert "reservations" in user_history
+    assert "statistics" in user_history
+    assert len(user_history["sessions"]) > 0
+    required_keys = frozenset({"session_id", "station_id", "status", "start_time", "end_time", "energy_consumed", "cost"})
+    for user_session in user_history["sessions"]:
+        assert isinstance(user_session, dict)
+        assert required_keys <= user_session.keys()
+    
+    # Processar pagamento
+    payment = blockchain_service.process_session_payment(
+        session.id,
+        valid_wallet_address,
+        valid_signature
+    )
+    
+    assert isinstance(payment, dict)
+    assert payment["session_id"] == session.id
+    assert payment["status"] == "paid"
+    assert payment["amount"] is not None
+    assert payment["timestamp"] is not None
+    assert "transaction_hash" in payment
+    assert "block_number" in payment
+    
+    # Históricos de pagamento do usuário e de receita da estação
+    payment_history = blockchain_service.get_user_payment_history(valid_wallet_address)
+    
+    assert isinstance(payment_history, list)
+    assert len(payment_history) > 0
+    required_keys = frozenset({"session_id", "amount", "timestamp", "transaction_hash", "status"})
+    for user_payment in payment_history:
+        assert isinstance(user_payment, dict)
+        assert required_keys <= user_payment.keys()
+    
+    revenue_history = blockchain_service.get_station_revenue_history(shared_station.id)
+    
+    assert isinstance(revenue_history, dict)
+    assert "payments" in revenue_history
+    assert "statistics" in revenue_history
+    assert len(revenue_history["payments"]) > 0
+    required_keys = frozenset({"session_id", "amount", "timestamp", "transaction_hash", "wallet_address"})
+    for station_payment in revenue_history["payments"]:
+        assert isinstance(station_payment, dict)
+        assert required_keys <= station_payment.keys()
 
 def test_invalid_wallet_address(blockchain_service):
     """Testa operações com endereço de carteira inválido."""
@@ -510,19 +484,11 @@ def test_invalid_reservation_id(blockchain_service):
             "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1b"
         )
 
-def test_station_busy(blockchain_service, valid_wallet_address, valid_signature):
+def test_station_busy(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa operações em estação ocupada."""
-    # Registrar estação e iniciar sessão
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
+    # Iniciar sessão
     blockchain_service.start_charging_session(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         valid_signature
     )
@@ -530,28 +496,18 @@ def test_station_busy(blockchain_service, valid_wallet_address, valid_signature)
     # Tentar iniciar outra sessão
     with pytest.raises(ResourceConflictError):
         blockchain_service.start_charging_session(
-            station.id,
+            shared_station.id,
             valid_wallet_address,
             valid_signature
         )
 
-def test_reservation_overlap(blockchain_service, valid_wallet_address, valid_signature):
+def test_reservation_overlap(blockchain_service, shared_station, valid_wallet_address, valid_signature):
     """Testa criação de reservas com sobreposição de horário."""
-    # Registrar estação
-    station_data = {
-        "location": "Test Location",
-        "power_output": 50.0,
-        "price_per_kwh": 0.5,
-        "owner_address": valid_wallet_address
-    }
-    station = blockchain_service.register_station(station_data)
-    
     # Criar primeira reserva
-    start_time = datetime.utcnow() + timedelta(hours=1)
-    end_time = start_time + timedelta(hours=2)
+    start_time, end_time = future_window()
     
     blockchain_service.create_charging_reservation(
-        station.id,
+        shared_station.id,
         valid_wallet_address,
         start_time,
         end_time,
@@ -561,17 +517,16 @@ def test_reservation_overlap(blockchain_service, valid_wallet_address, valid_sig
     # Tentar criar reserva com sobreposição
     with pytest.raises(ResourceConflictError):
         blockchain_service.create_charging_reservation(
-            station.id,
+            shared_station.id,
             valid_wallet_address,
-            start_time + timedelta(minutes=30),
-            end_time + timedelta(minutes=30),
+            *future_window(offset=timedelta(minutes=30)),
             valid_signature
         )
 
-def test_blockchain_error(blockchain_service, web3):
+def test_blockchain_error(blockchain_service, web3, monkeypatch):
     """Testa o tratamento de erro da blockchain."""
-    # Desconectar o Web3 para simular erro
-    web3.provider = None
+    # Desconectar o Web3 para simular erro (desfeito automaticamente ao final do teste)
+    monkeypatch.setattr(web3, "provider", None)
     
     with pytest.raises(BlockchainError):
         blockchain_service.register_user("0x742d35Cc6634C0532925a3b844Bc454e4438f44e")
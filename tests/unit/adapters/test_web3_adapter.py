@@ -0,0 +1,195 @@
+import pytest
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, MagicMock
+
+from web3 import Web3
+from web3.exceptions import Web3TypeError
+
+from adapters.blockchain.web3_adapter import Web3Adapter
+from domain.entities.session import SessionStatus
+from shared.constants.config import Config
+
+@pytest.fixture
+def web3_adapter():
+    """Fixture que retorna um adaptador Web3 sem conexão, com Web3 e contrato simulados."""
+    adapter = object.__new__(Web3Adapter)
+    adapter.logger = Mock()
+    adapter.w3 = Mock()
+    adapter.w3.to_checksum_address.side_effect = lambda address: address
+    adapter.w3.from_wei.side_effect = Web3.from_wei
+    adapter.contract = Mock()
+    adapter.multicall = None
+    adapter._read_cache = OrderedDict()
+    return adapter
+
+@pytest.fixture
+def mock_batch(web3_adapter):
+    """Fixture que retorna o lote JSON-RPC simulado aberto pelo adaptador."""
+    batch = MagicMock()
+    batch.__enter__.return_value = batch
+    web3_adapter.w3.batch_requests.return_value = batch
+    return batch
+
+def test_build_transaction_batched(web3_adapter, mock_batch, valid_wallet_address):
+    """Testa a montagem de uma transação com nonce e chainId lidos em um único lote."""
+    function = Mock()
+    mock_batch.execute.return_value = [7, 1337]
+    
+    # Montar transação
+    web3_adapter._build_transaction(function, valid_wallet_address, value=10)
+    
+    # Verificar resultado
+    assert mock_batch.add.call_count == 2
+    mock_batch.execute.assert_called_once()
+    function.build_transaction.assert_called_once_with({
+        "from": valid_wallet_address,
+        "value": 10,
+        "gas": Config.WEB3_GAS_LIMIT,
+        "nonce": 7,
+        "chainId": 1337
+    })
+
+def test_build_transaction_without_batch_support(web3_adapter, valid_wallet_address):
+    """Testa a montagem de uma transação em um provedor sem suporte a lote."""
+    function = Mock()
+    web3_adapter.w3.batch_requests.side_effect = Web3TypeError("Batch requests are not supported by this provider.")
+    web3_adapter.w3.eth.get_transaction_count.return_value = 7
+    web3_adapter.w3.eth.chain_id = 1337
+    
+    # Montar transação
+    web3_adapter._build_transaction(function, valid_wallet_address)
+    
+    # Verificar resultado
+    web3_adapter.w3.eth.get_transaction_count.assert_called_once_with(valid_wallet_address)
+    function.build_transaction.assert_called_once_with({
+        "from": valid_wallet_address,
+        "value": 0,
+        "gas": Config.WEB3_GAS_LIMIT,
+        "nonce": 7,
+        "chainId": 1337
+    })
+
+async def test_get_sessions_batch(web3_adapter, mock_batch, valid_wallet_address, now):
+    """Testa a conversão do retorno de getSession do contrato nas entidades Session."""
+    start_time = int(now.timestamp())
+    end_time = int((now + timedelta(hours=1)).timestamp())
+    
+    # Retorno de getSession: (user, stationId, startTime, endTime, active, paid, amount)
+    mock_batch.execute.return_value = [
+        (valid_wallet_address, 1, start_time, 0, True, False, 0),
+        (valid_wallet_address, 2, start_time, end_time, False, False, 0),
+        (valid_wallet_address, 2, start_time, end_time, False, True, 10**15)
+    ]
+    
+    # Obter sessões
+    sessions = await web3_adapter.get_sessions_batch([3, 7, 9])
+    
+    # Verificar resultado
+    assert [session.id for session in sessions] == [3, 7, 9]
+    assert [session.station_id for session in sessions] == [1, 2, 2]
+    assert all(session.user_address == valid_wallet_address for session in sessions)
+    assert all(session.start_time == datetime.fromtimestamp(start_time) for session in sessions)
+    assert [session.end_time for session in sessions] == [
+        None,
+        datetime.fromtimestamp(end_time),
+        datetime.fromtimestamp(end_time)
+    ]
+    assert [session.status for session in sessions] == [
+        SessionStatus.ACTIVE,
+        SessionStatus.COMPLETED,
+        SessionStatus.PAID
+    ]
+    assert [session.payment_amount for session in sessions] == [None, None, Decimal("0.001")]
+    assert [c.args for c in web3_adapter.contract.functions.getSession.call_args_list] == [(3,), (7,), (9,)]
+
+async def test_get_user_sessions(web3_adapter, mock_batch, valid_wallet_address, now):
+    """Testa a obtenção das sessões de um usuário pelos IDs registrados no contrato."""
+    start_time = int(now.timestamp())
+    get_user_sessions = web3_adapter.contract.functions.getUserSessions
+    get_user_sessions.return_value.call.return_value = [3, 7]
+    mock_batch.execute.return_value = [
+        (valid_wallet_address, 1, start_time, 0, True, False, 0),
+        (valid_wallet_address, 2, start_time, start_time + 3600, False, True, 10**15)
+    ]
+    
+    # Obter sessões
+    sessions = await web3_adapter.get_user_sessions(valid_wallet_address)
+    
+    # Verificar resultado
+    assert [session.id for session in sessions] == [3, 7]
+    get_user_sessions.assert_called_once_with(valid_wallet_address)
+    assert [c.args for c in web3_adapter.contract.functions.getSession.call_args_list] == [(3,), (7,)]
+
+async def test_get_station_sessions_status_filter(web3_adapter, mock_batch, valid_wallet_address, now):
+    """Testa a obtenção das sessões de uma estação filtradas por status."""
+    station_id = 2
+    start_time = int(now.timestamp())
+    get_station_sessions = web3_adapter.contract.functions.getStationSessions
+    get_station_sessions.return_value.call.return_value = [3, 7]
+    mock_batch.execute.return_value = [
+        (valid_wallet_address, station_id, start_time, 0, True, False, 0),
+        (valid_wallet_address, station_id, start_time, start_time + 3600, False, True, 10**15)
+    ]
+    
+    # Obter sessões pagas
+    sessions = await web3_adapter.get_station_sessions(station_id, SessionStatus.PAID.value)
+    
+    # Verificar resultado
+    assert [session.id for session in sessions] == [7]
+    assert sessions[0].status == SessionStatus.PAID
+    get_station_sessions.assert_called_once_with(station_id)
+
+def test_cached_call_same_block(web3_adapter, valid_wallet_address):
+    """Testa que leituras repetidas no mesmo bloco fazem uma única eth_call."""
+    web3_adapter.w3.eth.block_number = 10
+    get_user = web3_adapter.contract.functions.getUser
+    get_user.return_value.call.return_value = (1, 0, 0, 1)
+    
+    # Ler duas vezes no mesmo bloco
+    first = web3_adapter._cached_call("getUser", valid_wallet_address)
+    second = web3_adapter._cached_call("getUser", valid_wallet_address)
+    
+    # Verificar resultado
+    assert first == second == (1, 0, 0, 1)
+    get_user.return_value.call.assert_called_once_with(block_identifier=10)
+
+def test_cached_call_new_block(web3_adapter, valid_wallet_address):
+    """Testa que um bloco novo refaz a leitura."""
+    web3_adapter.w3.eth.block_number = 10
+    get_user = web3_adapter.contract.functions.getUser
+    get_user.return_value.call.side_effect = [(1, 0, 0, 1), (2, 0, 0, 2)]
+    
+    # Ler antes e depois de um bloco novo
+    first = web3_adapter._cached_call("getUser", valid_wallet_address)
+    web3_adapter.w3.eth.block_number = 11
+    second = web3_adapter._cached_call("getUser", valid_wallet_address)
+    
+    # Verificar resultado
+    assert first == (1, 0, 0, 1)
+    assert second == (2, 0, 0, 2)
+    assert [c.kwargs for c in get_user.return_value.call.call_args_list] == [
+        {"block_identifier": 10},
+        {"block_identifier": 11}
+    ]
+
+def test_cached_call_evicts_least_recently_used(web3_adapter, monkeypatch):
+    """Testa que o cache cheio descarta só a leitura usada há mais tempo."""
+    monkeypatch.setattr(Config, "WEB3_READ_CACHE_SIZE", 2)
+    web3_adapter.w3.eth.block_number = 10
+    get_session = web3_adapter.contract.functions.getSession
+    get_session.side_effect = lambda session_id: Mock(**{"call.return_value": session_id})
+    
+    # Ler três sessões, usando a primeira de novo antes da terceira
+    web3_adapter._cached_call("getSession", 1)
+    web3_adapter._cached_call("getSession", 2)
+    web3_adapter._cached_call("getSession", 1)
+    web3_adapter._cached_call("getSession", 3)
+    
+    # Verificar resultado
+    assert list(web3_adapter._read_cache) == [
+        ("getSession", 1, 10),
+        ("getSession", 3, 10)
+    ]
+    assert [c.args for c in get_session.call_args_list] == [(1,), (2,), (3,)]
@@ -5,13 +5,13 @@ from decimal import Decimal
 from domain.entities.session import Session, SessionStatus
 from domain.exceptions.custom_exceptions import ValidationError
 
-def test_create_session():
+def test_create_session(now):
     """Testa a criação de uma sessão com dados válidos."""
     session = Session(
         id=1,
         user_address="0x1234567890123456789012345678901234567890",
         station_id=1,
-        start_time=datetime.utcnow(),
+        start_time=now,
         end_time=None,
         status=SessionStatus.ACTIVE,
         payment_amount=None,
@@ -27,9 +27,9 @@ def test_create_session():
     assert session.payment_amount is None
     assert session.payment_time is None
 
-def test_start_session(mock_session):
+def test_start_session(mock_session, now):
     """Testa o início de uma sessão."""
-    start_time = datetime.utcnow()
+    start_time = now
     mock_session.start(start_time)
     
     assert mock_session.start_time == start_time
@@ -38,9 +38,9 @@ def test_start_session(mock_session):
     assert mock_session.payment_amount is None
     assert mock_session.payment_time is None
 
-def test_end_session(mock_session):
+def test_end_session(mock_session, now):
     """Testa o fim de uma sessão."""
-    start_time = datetime.utcnow()
+    start_time = now
     end_time = start_time + timedelta(hours=2)
     
     mock_session.start(start_time)
@@ -50,9 +50,9 @@ def test_end_session(mock_session):
     assert mock_session.status == SessionStatus.COMPLETED
     assert mock_session.duration == timedelta(hours=2)
 
-def test_pay_session(mock_session):
+def test_pay_session(mock_session, now):
     """Testa o pagamento de uma sessão."""
-    start_time = datetime.utcnow()
+    start_time = now
     end_time = start_time + timedelta(hours=2)
     payment_time = end_time + timedelta(minutes=5)
     amount = Decimal('0.002')
@@ -65,9 +65,9 @@ def test_pay_session(mock_session):
     assert mock_session.payment_time == payment_time
     assert mock_session.status == SessionStatus.PAID
 
-def test_cancel_session(mock_session):
+def test_cancel_session(mock_session, now):
     """Testa o cancelamento de uma sessão."""
-    start_time = datetime.utcnow()
+    start_time = now
     mock_session.start(start_time)
     mock_session.cancel()
     
@@ -76,9 +76,9 @@ def test_cancel_session(mock_session):
     assert mock_session.payment_amount is None
     assert mock_session.payment_time is None
 
-def test_get_duration(mock_session):
+def test_get_duration(mock_session, now):
     """Testa o cálculo da duração de uma sessão."""
-    start_time = datetime.utcnow()
+    start_time = now
     end_time = start_time + timedelta(hours=2, minutes=30)
     
     mock_session.start(start_time)
@@ -87,6 +87,34 @@ def test_get_duration(mock_session):
     assert mock_session.duration == timedelta(hours=2, minutes=30)
     assert mock_session.duration_hours == Decimal('2.5')
 
+@pytest.mark.parametrize("status,is_active,is_paid", [
+    (SessionStatus.PENDING, False, False),
+    (SessionStatus.ACTIVE, True, False),
+    (SessionStatus.COMPLETED, False, False),
+    (SessionStatus.PAID, False, True),
+    (SessionStatus.CANCELLED, False, False),
+])
+def test_session_state_properties(mock_session, status, is_active, is_paid):
+    """Testa as propriedades de estado de uma sessão."""
+    mock_session.status = status
+    
+    assert mock_session.is_active is is_active
+    assert mock_session.is_paid is is_paid
+
+def test_duration_properties(mock_session, now):
+    """Testa a duração de uma sessão finalizada."""
+    mock_session.start_time = now
+    mock_session.end_time = now + timedelta(hours=2, minutes=30)
+    
+    assert mock_session.duration == timedelta(hours=2, minutes=30)
+    assert mock_session.duration_hours == 2.5
+
+def test_duration_properties_not_ended(mock_session):
+    """Testa a duração de uma sessão ainda não finalizada."""
+    assert mock_session.end_time is None
+    assert mock_session.duration is None
+    assert mock_session.duration_hours is None
+
 def test_to_dict(mock_session):
     """Testa a conversão da sessão para dicionário."""
     session_dict = mock_session.to_dict()
@@ -101,9 +129,9 @@ def test_to_dict(mock_session):
     assert session_dict["payment_amount"] is None
     assert session_dict["payment_time"] is None
 
-def test_from_dict():
+def test_from_dict(now):
     """Testa a criação de uma sessão a partir de um dicionário."""
-    start_time = datetime.utcnow()
+    start_time = now
     end_time = start_time + timedelta(hours=2)
     payment_time = end_time + timedelta(minutes=5)
     
@@ -129,14 +157,14 @@ def test_from_dict():
     assert session.payment_amount == Decimal(data["payment_amount"])
     assert session.payment_time == payment_time
 
-def test_start_already_started_session(mock_session):
+def test_start_already_started_session(mock_session, now):
     """Testa o início de uma sessão já iniciada."""
-    mock_session.start(datetime.utcnow())
+    mock_session.start(now)
     
     with pytest.raises(ValidationError):
-        mock_session.start(datetime.utcnow())
+        mock_session.start(now)
 
-def test_end_not_started_session():
+def test_end_not_started_session(now):
     """Testa o fim de uma sessão não iniciada."""
     session = Session(
         id=1,
@@ -145,11 +173,11 @@ def test_end_not_started_session():
     )
     
     with pytest.raises(ValidationError):
-        session.end(datetime.utcnow())
+        session.end(now)
 
-def test_end_already_ended_session(mock_session):
+def test_end_already_ended_session(mock_session, now):
     """Testa o fim de uma sessão já finalizada."""
-    start_time = datetime.utcnow()
+    start_time = now
     end_time = start_time + timedelta(hours=2)
     
     mock_session.start(start_time)
@@ -158,16 +186,16 @@ def test_end_already_ended_session(mock_session):
     with pytest.raises(ValidationError):
         mock_session.end(end_time + timedelta(hours=1))
 
-def test_pay_not_ended_session(mock_session):
+def test_pay_not_ended_session(mock_session, now):
     """Testa o pagamento de uma sessão não finalizada."""
-    mock_session.start(datetime.utcnow())
+    mock_session.start(now)
     
     with pytest.raises(ValidationError):
-        mock_session.pay(Decimal('0.001'), datetime.utcnow())
+        mock_session.pay(Decimal('0.001'), now)
 
-def test_pay_already_paid_session(mock_session):
+def test_pay_already_paid_session(mock_session, now):
     """Testa o pagamento de uma sessão já paga."""
-    start_time = datetime.utcnow()
+    start_time = now
     end_time = start_time + timedelta(hours=2)
     payment_time = end_time + timedelta(minutes=5)
     
@@ -189,9 +217,9 @@ def test_cancel_not_started_session():
     with pytest.raises(ValidationError):
         session.cancel()
 
-def test_cancel_already_ended_session(mock_session):
+def test_cancel_already_ended_session(mock_session, now):
     """Testa o cancelamento de uma sessão já finalizada."""
-    start_time = datetime.utcnow()
+    start_time = now
     end_time = start_time + timedelta(hours=2)
     
     mock_session.start(start_time)
@@ -200,20 +228,20 @@ def test_cancel_already_ended_session(mock_session):
     with pytest.raises(ValidationError):
         mock_session.cancel()
 
-def test_negative_payment_amount(mock_session):
+def test_negative_payment_amount(mock_session, now):
     """Testa o pagamento com valor negativo."""
-    start_time = datetime.utcnow()
+    start_time = now
     end_time = start_time + timedelta(hours=2)
     
     mock_session.start(start_time)
     mock_session.end(end_time)
     
     with pytest.raises(ValidationError):
-        mock_session.pay(Decimal('-0.001'), datetime.utcnow())
+        mock_session.pay(Decimal('-0.001'), now)
 
-def test_get_duration_not_ended_session(mock_session):
+def test_get_duration_not_ended_session(mock_session, now):
     """Testa o cálculo da duração de uma sessão não finalizada."""
-    mock_session.start(datetime.utcnow())
+    mock_session.start(now)
     
     with pytest.raises(ValidationError):
         _ = mock_session.duration 
\ No newline at end of file
@@ -1,8 +1,8 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from decimal import Decimal
 
-from domain.entities.station import Station
+from domain.entities.station import Station, StationReservation
 from domain.exceptions.custom_exceptions import (
     ValidationError,
     ResourceConflictError
@@ -32,10 +32,10 @@ def test_create_station():
     assert station.total_sessions == 0
     assert station.total_revenue == Decimal('0.0')
 
-def test_add_reservation(mock_station):
+def test_add_reservation(mock_station, now):
     """Testa a adição de uma reserva."""
     user_address = "0x1234567890123456789012345678901234567890"
-    start_time = datetime.utcnow() + timedelta(hours=1)
+    start_time = now + timedelta(hours=1)
     end_time = start_time + timedelta(hours=2)
     
     mock_station.add_reservation(user_address, start_time, end_time)
@@ -43,14 +43,30 @@ def test_add_reservation(mock_station):
     date_key = start_time.date().isoformat()
     assert date_key in mock_station.reservations
     assert len(mock_station.reservations[date_key]) == 1
-    assert mock_station.reservations[date_key][0]["user_address"] == user_address
-    assert mock_station.reservations[date_key][0]["start_time"] == start_time
-    assert mock_station.reservations[date_key][0]["end_time"] == end_time
+    assert mock_station.reservations[date_key][0].user_address == user_address
+    assert mock_station.reservations[date_key][0].start_time == start_time
+    assert mock_station.reservations[date_key][0].end_time == end_time
 
-def test_remove_reservation(mock_station):
+def test_reservations_view_is_a_copy(mock_station, now):
+    """Testa que alterar as reservas lidas não altera a estação."""
+    user_address = "0x1234567890123456789012345678901234567890"
+    start_time = now + timedelta(hours=1)
+    end_time = start_time + timedelta(hours=2)
+    mock_station.add_reservation(user_address, start_time, end_time)
+    date_key = start_time.date().isoformat()
+    
+    reservations = mock_station.reservations
+    reservations[date_key].clear()
+    reservations["2000-01-01"] = []
+    
+    assert list(mock_station.reservations) == [date_key]
+    assert len(mock_station.reservations[date_key]) == 1
+    assert len(mock_station.to_dict()["reservations"][date_key]) == 1
+
+def test_remove_reservation(mock_station, now):
     """Testa a remoção de uma reserva."""
     user_address = "0x1234567890123456789012345678901234567890"
-    start_time = datetime.utcnow() + timedelta(hours=1)
+    start_time = now + timedelta(hours=1)
     end_time = start_time + timedelta(hours=2)
     
     mock_station.add_reservation(user_address, start_time, end_time)
@@ -59,10 +75,10 @@ def test_remove_reservation(mock_station):
     date_key = start_time.date().isoformat()
     assert date_key not in mock_station.reservations or len(mock_station.reservations[date_key]) == 0
 
-def test_is_reserved_at(mock_station):
+def test_is_reserved_at(mock_station, now):
     """Testa a verificação de reserva em um horário específico."""
     user_address = "0x1234567890123456789012345678901234567890"
-    start_time = datetime.utcnow() + timedelta(hours=1)
+    start_time = now + timedelta(hours=1)
     end_time = start_time + timedelta(hours=2)
     
     mock_station.add_reservation(user_address, start_time, end_time)
@@ -73,10 +89,10 @@ def test_is_reserved_at(mock_station):
     # Testa horário fora da reserva
     assert not mock_station.is_reserved_at(start_time + timedelta(hours=3))
 
-def test_get_reservation_user(mock_station):
+def test_get_reservation_user(mock_station, now):
     """Testa a obtenção do usuário que fez uma reserva."""
     user_address = "0x1234567890123456789012345678901234567890"
-    start_time = datetime.utcnow() + timedelta(hours=1)
+    start_time = now + timedelta(hours=1)
     end_time = start_time + timedelta(hours=2)
     
     mock_station.add_reservation(user_address, start_time, end_time)
@@ -113,18 +129,18 @@ def test_to_dict(mock_station):
     """Testa a conversão da estação para dicionário."""
     station_dict = mock_station.to_dict()
     
-    assert isinstance(station_dict, dict)
+    assert type(station_dict) is dict
     assert station_dict["id"] == mock_station.id
     assert station_dict["location"] == mock_station.location
-    assert isinstance(station_dict["power_output"], str)
-    assert isinstance(station_dict["price_per_hour"], str)
+    assert type(station_dict["power_output"]) is str
+    assert type(station_dict["price_per_hour"]) is str
     assert station_dict["is_available"] == mock_station.is_available
     assert station_dict["current_session_id"] == mock_station.current_session_id
-    assert isinstance(station_dict["reservations"], dict)
+    assert type(station_dict["reservations"]) is dict
     assert station_dict["total_sessions"] == mock_station.total_sessions
-    assert isinstance(station_dict["total_revenue"], str)
+    assert type(station_dict["total_revenue"]) is str
 
-def test_from_dict():
+def test_from_dict(now):
     """Testa a criação de uma estação a partir de um dicionário."""
     data = {
         "id": 1,
@@ -136,8 +152,8 @@ def test_from_dict():
         "reservations": {
             "2024-02-20": [{
                 "user_address": "0x1234567890123456789012345678901234567890",
-                "start_time": datetime.utcnow().isoformat(),
-                "end_time": (datetime.utcnow() + timedelta(hours=2)).isoformat()
+                "start_time": now.isoformat(),
+                "end_time": (now + timedelta(hours=2)).isoformat()
             }]
         },
         "total_sessions": 1,
@@ -178,10 +194,10 @@ def test_invalid_price():
             is_available=True
         )
 
-def test_duplicate_reservation(mock_station):
+def test_duplicate_reservation(mock_station, now):
     """Testa a adição de uma reserva duplicada."""
     user_address = "0x1234567890123456789012345678901234567890"
-    start_time = datetime.utcnow() + timedelta(hours=1)
+    start_time = now + timedelta(hours=1)
     end_time = start_time + timedelta(hours=2)
     
     mock_station.add_reservation(user_address, start_time, end_time)
@@ -189,10 +205,10 @@ def test_duplicate_reservation(mock_station):
     with pytest.raises(ResourceConflictError):
         mock_station.add_reservation(user_address, start_time, end_time)
 
-def test_reservation_overlap(mock_station):
+def test_reservation_overlap(mock_station, now):
     """Testa a adição de uma reserva com sobreposição de horário."""
     user_address = "0x1234567890123456789012345678901234567890"
-    start_time = datetime.utcnow() + timedelta(hours=1)
+    start_time = now + timedelta(hours=1)
     end_time = start_time + timedelta(hours=2)
     
     mock_station.add_reservation(user_address, start_time, end_time)
@@ -204,12 +220,74 @@ def test_reservation_overlap(mock_station):
             end_time + timedelta(minutes=30)
         )
 
-def test_remove_nonexistent_reservation(mock_station):
+def test_load_overlapping_reservations(now):
+    """Testa o carregamento de reservas persistidas que se sobrepõem."""
+    start_time = now + timedelta(hours=1)
+    long_reservation = StationReservation(
+        "0x1234567890123456789012345678901234567890", start_time, start_time + timedelta(hours=4)
+    )
+    short_reservation = StationReservation(
+        "0x0987654321098765432109876543210987654321",
+        start_time + timedelta(hours=1),
+        start_time + timedelta(hours=2)
+    )
+    station = Station(
+        id=1,
+        location="Test Location",
+        power_output=Decimal('7.4'),
+        price_per_hour=Decimal('0.001'),
+        reservations={start_time.date().isoformat(): [long_reservation, short_reservation]}
+    )
+    
+    assert station.get_reservation_user(start_time + timedelta(hours=3)) == long_reservation.user_address
+    assert station.get_reservation_user(start_time + timedelta(minutes=90)) == short_reservation.user_address
+    
+    with pytest.raises(ResourceConflictError):
+        station.add_reservation(
+            short_reservation.user_address,
+            start_time + timedelta(hours=3),
+            start_time + timedelta(hours=5)
+        )
+
+def test_from_dict_validate_reservations(now):
+    """Testa a recusa opcional de reservas persistidas que se sobrepõem."""
+    start_time = now + timedelta(hours=1)
+    data = {
+        "id": 1,
+        "location": "Test Location",
+        "power_output": "7.4",
+        "price_per_hour": "0.001",
+        "is_available": True,
+        "current_session_id": None,
+        "reservations": {
+            start_time.date().isoformat(): [
+                {
+                    "user_address": "0x1234567890123456789012345678901234567890",
+                    "start_time": start_time.isoformat(),
+                    "end_time": (start_time + timedelta(hours=4)).isoformat()
+                },
+                {
+                    "user_address": "0x0987654321098765432109876543210987654321",
+                    "start_time": (start_time + timedelta(hours=1)).isoformat(),
+                    "end_time": (start_time + timedelta(hours=2)).isoformat()
+                }
+            ]
+        },
+        "total_sessions": 0,
+        "total_revenue": "0"
+    }
+    
+    assert Station.from_dict(data).is_reserved_at(start_time + timedelta(hours=3))
+    
+    with pytest.raises(ResourceConflictError):
+        Station.from_dict(data, validate_reservations=True)
+
+def test_remove_nonexistent_reservation(mock_station, now):
     """Testa a remoção de uma reserva inexistente."""
     with pytest.raises(ValidationError):
         mock_station.remove_reservation(
             "0x1234567890123456789012345678901234567890",
-            datetime.utcnow()
+            now
         )
 
 def test_start_session_when_busy(mock_station):
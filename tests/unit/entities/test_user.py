@@ -81,25 +81,25 @@ def test_to_dict(mock_user):
     """Testa a conversão do usuário para dicionário."""
     user_dict = mock_user.to_dict()
     
-    assert isinstance(user_dict, dict)
+    assert type(user_dict) is dict
     assert user_dict["wallet_address"] == mock_user.wallet_address
     assert user_dict["email"] == mock_user.email
     assert user_dict["name"] == mock_user.name
-    assert isinstance(user_dict["created_at"], str)
-    assert isinstance(user_dict["last_login"], str) if mock_user.last_login else user_dict["last_login"] is None
+    assert type(user_dict["created_at"]) is str
+    assert type(user_dict["last_login"]) is str if mock_user.last_login else user_dict["last_login"] is None
     assert user_dict["active_sessions"] == mock_user.active_sessions
-    assert isinstance(user_dict["total_charges"], str)
+    assert type(user_dict["total_charges"]) is str
     assert user_dict["total_sessions"] == mock_user.total_sessions
     assert user_dict["active_reservations"] == mock_user.active_reservations
 
-def test_from_dict():
+def test_from_dict(now):
     """Testa a criação de um usuário a partir de um dicionário."""
     data = {
         "wallet_address": "0x1234567890123456789012345678901234567890",
         "email": "test@example.com",
         "name": "Test User",
-        "created_at": datetime.utcnow().isoformat(),
-        "last_login": datetime.utcnow().isoformat(),
+        "created_at": now.isoformat(),
+        "last_login": now.isoformat(),
         "active_sessions": [1, 2],
         "total_charges": "0.001",
         "total_sessions": 2,
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from decimal import Decimal
 
 from domain.entities.session import SessionStatus
@@ -10,14 +10,13 @@ from domain.exceptions.custom_exceptions import (
     BlockchainError
 )
 
-@pytest.mark.asyncio
-async def test_start_session_success(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_session_data):
+async def test_start_session_success(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_session_data, station_factory, user_factory):
     """Testa o início bem-sucedido de uma sessão."""
     # Configurar mocks
     mock_http_port.validate_wallet_address.return_value = True
     mock_http_port.validate_signature.return_value = True
-    mock_blockchain_port.get_station.return_value = mock_station()
-    mock_blockchain_port.get_user.return_value = mock_user()
+    mock_blockchain_port.get_station.return_value = station_factory()
+    mock_blockchain_port.get_user.return_value = user_factory()
     
     # Executar caso de uso
     result = await mock_charge_use_case.start_session(
@@ -37,15 +36,14 @@ async def test_start_session_success(mock_charge_use_case, mock_http_port, mock_
     mock_blockchain_port.get_station.assert_called_once_with(valid_session_data["station_id"])
     mock_blockchain_port.get_user.assert_called_once_with(valid_session_data["wallet_address"])
 
-@pytest.mark.asyncio
-async def test_end_session_success(mock_charge_use_case, mock_http_port, mock_blockchain_port):
+async def test_end_session_success(mock_charge_use_case, mock_http_port, mock_blockchain_port, now, session_factory):
     """Testa o fim bem-sucedido de uma sessão."""
     session_id = 1
-    mock_session = mock_session()
-    mock_session.start(datetime.utcnow())
+    session = session_factory()
+    session.start(now)
     
     # Configurar mocks
-    mock_blockchain_port.get_session.return_value = mock_session
+    mock_blockchain_port.get_session.return_value = session
     
     # Executar caso de uso
     result = await mock_charge_use_case.end_session(session_id)
@@ -58,16 +56,14 @@ async def test_end_session_success(mock_charge_use_case, mock_http_port, mock_bl
     # Verificar chamadas aos mocks
     mock_blockchain_port.get_session.assert_called_once_with(session_id)
 
-@pytest.mark.asyncio
-async def test_get_user_sessions_success(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_wallet_address):
+async def test_get_user_sessions_success(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_wallet_address, mock_session_pool, user_factory):
     """Testa a obtenção bem-sucedida das sessões de um usuário."""
     # Configurar mocks
+    user = user_factory()
+    user.total_sessions = 2
     mock_http_port.validate_wallet_address.return_value = True
-    mock_blockchain_port.get_user.return_value = mock_user()
-    mock_blockchain_port.get_session.side_effect = [
-        mock_session(),
-        mock_session()
-    ]
+    mock_blockchain_port.get_user.return_value = user
+    mock_blockchain_port.get_sessions_batch.return_value = list(mock_session_pool[:2])
     
     # Executar caso de uso
     result = await mock_charge_use_case.get_user_sessions(valid_wallet_address)
@@ -80,31 +76,48 @@ async def test_get_user_sessions_success(mock_charge_use_case, mock_http_port, m
     # Verificar chamadas aos mocks
     mock_http_port.validate_wallet_address.assert_called_once_with(valid_wallet_address)
     mock_blockchain_port.get_user.assert_called_once_with(valid_wallet_address)
+    mock_blockchain_port.get_sessions_batch.assert_called_once_with([1, 2])
 
-@pytest.mark.asyncio
-async def test_get_station_sessions_success(mock_charge_use_case, mock_http_port, mock_blockchain_port):
+async def test_get_station_sessions_success(mock_charge_use_case, mock_http_port, mock_blockchain_port, mock_session_pool, station_factory):
     """Testa a obtenção bem-sucedida das sessões de uma estação."""
     station_id = 1
     
     # Configurar mocks
-    mock_blockchain_port.get_station.return_value = mock_station()
-    mock_blockchain_port.get_session.side_effect = [
-        mock_session(),
-        mock_session()
-    ]
+    mock_blockchain_port.get_station.return_value = station_factory()
+    mock_blockchain_port.get_station_sessions.return_value = list(mock_session_pool[:2])
     
     # Executar caso de uso
-    result = await mock_charge_use_case.get_station_sessions(station_id)
+    result = await mock_charge_use_case.get_station_sessions(station_id, status="active")
     
     # Verificar resultado
     assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(isinstance(session, dict) for session in result)
+    assert [session["id"] for session in result] == [1, 2]
     
     # Verificar chamadas aos mocks
     mock_blockchain_port.get_station.assert_called_once_with(station_id)
+    mock_blockchain_port.get_station_sessions.assert_called_once_with(station_id, "active")
+
+async def test_get_station_sessions_date_filter(mock_charge_use_case, mock_blockchain_port, now, session_factory):
+    """Testa o filtro por data das sessões de uma estação."""
+    station_id = 1
+    sessions = [session_factory(session_id) for session_id in range(1, 4)]
+    for offset, session in enumerate(sessions):
+        session.start_time = now + timedelta(days=offset)
+    
+    # Configurar mocks
+    mock_blockchain_port.get_station_sessions.return_value = sessions
+    
+    # Executar caso de uso
+    result = await mock_charge_use_case.get_station_sessions(
+        station_id,
+        start_date=now + timedelta(days=1),
+        end_date=now + timedelta(days=1)
+    )
+    
+    # Verificar resultado
+    assert [session["id"] for session in result] == [2]
+    mock_blockchain_port.get_station_sessions.assert_called_once_with(station_id, None)
 
-@pytest.mark.asyncio
 async def test_start_session_invalid_wallet(mock_charge_use_case, mock_http_port, valid_session_data):
     """Testa o início de sessão com carteira inválida."""
     # Configurar mocks
@@ -121,7 +134,6 @@ async def test_start_session_invalid_wallet(mock_charge_use_case, mock_http_port
     # Verificar chamadas aos mocks
     mock_http_port.validate_wallet_address.assert_called_once_with(valid_session_data["wallet_address"])
 
-@pytest.mark.asyncio
 async def test_start_session_invalid_signature(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_session_data):
     """Testa o início de sessão com assinatura inválida."""
     # Configurar mocks
@@ -140,7 +152,6 @@ async def test_start_session_invalid_signature(mock_charge_use_case, mock_http_p
     mock_http_port.validate_wallet_address.assert_called_once_with(valid_session_data["wallet_address"])
     mock_http_port.validate_signature.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_start_session_station_not_found(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_session_data):
     """Testa o início de sessão com estação inexistente."""
     # Configurar mocks
@@ -161,13 +172,12 @@ async def test_start_session_station_not_found(mock_charge_use_case, mock_http_p
     mock_http_port.validate_signature.assert_called_once()
     mock_blockchain_port.get_station.assert_called_once_with(valid_session_data["station_id"])
 
-@pytest.mark.asyncio
-async def test_start_session_station_busy(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_session_data):
+async def test_start_session_station_busy(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_session_data, station_factory):
     """Testa o início de sessão em estação ocupada."""
     # Configurar mocks
     mock_http_port.validate_wallet_address.return_value = True
     mock_http_port.validate_signature.return_value = True
-    station = mock_station()
+    station = station_factory()
     station.start_session(1)  # Marcar estação como ocupada
     mock_blockchain_port.get_station.return_value = station
     
@@ -184,7 +194,6 @@ async def test_start_session_station_busy(mock_charge_use_case, mock_http_port,
     mock_http_port.validate_signature.assert_called_once()
     mock_blockchain_port.get_station.assert_called_once_with(valid_session_data["station_id"])
 
-@pytest.mark.asyncio
 async def test_end_session_not_found(mock_charge_use_case, mock_blockchain_port):
     """Testa o fim de uma sessão inexistente."""
     session_id = 999
@@ -199,16 +208,15 @@ async def test_end_session_not_found(mock_charge_use_case, mock_blockchain_port)
     # Verificar chamadas aos mocks
     mock_blockchain_port.get_session.assert_called_once_with(session_id)
 
-@pytest.mark.asyncio
-async def test_end_session_already_ended(mock_charge_use_case, mock_blockchain_port):
+async def test_end_session_already_ended(mock_charge_use_case, mock_blockchain_port, now, session_factory):
     """Testa o fim de uma sessão já finalizada."""
     session_id = 1
-    mock_session = mock_session()
-    mock_session.start(datetime.utcnow())
-    mock_session.end(datetime.utcnow() + timedelta(hours=2))
+    session = session_factory()
+    session.start(now)
+    session.end(now + timedelta(hours=2))
     
     # Configurar mocks
-    mock_blockchain_port.get_session.return_value = mock_session
+    mock_blockchain_port.get_session.return_value = session
     
     # Executar caso de uso e verificar exceção
     with pytest.raises(ValidationError):
@@ -217,7 +225,6 @@ async def test_end_session_already_ended(mock_charge_use_case, mock_blockchain_p
     # Verificar chamadas aos mocks
     mock_blockchain_port.get_session.assert_called_once_with(session_id)
 
-@pytest.mark.asyncio
 async def test_get_user_sessions_user_not_found(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_wallet_address):
     """Testa a obtenção de sessões de um usuário inexistente."""
     # Configurar mocks
@@ -232,7 +239,6 @@ async def test_get_user_sessions_user_not_found(mock_charge_use_case, mock_http_
     mock_http_port.validate_wallet_address.assert_called_once_with(valid_wallet_address)
     mock_blockchain_port.get_user.assert_called_once_with(valid_wallet_address)
 
-@pytest.mark.asyncio
 async def test_get_station_sessions_station_not_found(mock_charge_use_case, mock_blockchain_port):
     """Testa a obtenção de sessões de uma estação inexistente."""
     station_id = 999
@@ -247,7 +253,6 @@ async def test_get_station_sessions_station_not_found(mock_charge_use_case, mock
     # Verificar chamadas aos mocks
     mock_blockchain_port.get_station.assert_called_once_with(station_id)
 
-@pytest.mark.asyncio
 async def test_blockchain_error(mock_charge_use_case, mock_http_port, mock_blockchain_port, valid_session_data):
     """Testa o tratamento de erro da blockchain."""
     # Configurar mocks
@@ -1,8 +1,9 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from decimal import Decimal
+from unittest.mock import call
 
-from domain.entities.session import SessionStatus
+from domain.entities.session import Session, SessionStatus
 from domain.exceptions.custom_exceptions import (
     ValidationError,
     ResourceNotFoundError,
@@ -10,47 +11,95 @@ from domain.exceptions.custom_exceptions import (
     BlockchainError
 )
 
-@pytest.mark.asyncio
-async def test_process_payment_success(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_payment_data):
+from tests.data import VALID_PAYMENT_DATA
+
+# Valor usado para marcar sessões de teste como pagas
+PAID_AMOUNT = Decimal("50.00")
+
+# Duração das sessões de teste finalizadas
+SESSION_DURATION = timedelta(hours=2)
+
+# Valor que cobre uma sessão de SESSION_DURATION à taxa de 0.001 ETH por hora
+PAYMENT_AMOUNT = Decimal("0.002")
+
+# Chamadas esperadas aos mocks durante o processamento de pagamento
+_VALIDATE_WALLET = call.validate_wallet_address(VALID_PAYMENT_DATA["wallet_address"])
+_PARSE_AMOUNT = call.parse_decimal(VALID_PAYMENT_DATA["amount"])
+_GET_USER = call.get_user(VALID_PAYMENT_DATA["wallet_address"])
+_GET_SESSION = call.get_session(VALID_PAYMENT_DATA["session_id"])
+
+def _session_in_state(status, start_time=None, end_time=None, payment_amount=None, payment_time=None):
+    """Cria uma sessão de teste diretamente no estado informado."""
+    return Session(
+        id=VALID_PAYMENT_DATA["session_id"],
+        user_address=VALID_PAYMENT_DATA["wallet_address"],
+        station_id=1,
+        start_time=start_time,
+        end_time=end_time,
+        status=status,
+        payment_amount=payment_amount,
+        payment_time=payment_time
+    )
+
+@pytest.fixture(scope="module")
+def session_states(now):
+    """
+    Fixture que retorna uma sessão de teste em cada estado, criadas uma única vez por módulo.
+    O caso de uso apenas lê as sessões, então a mesma instância serve a todos os testes.
+    """
+    ended_at = now + SESSION_DURATION
+    return {
+        "created": _session_in_state(SessionStatus.PENDING),
+        "active": _session_in_state(SessionStatus.ACTIVE, start_time=now),
+        "ended": _session_in_state(SessionStatus.COMPLETED, start_time=now, end_time=ended_at),
+        "paid": _session_in_state(
+            SessionStatus.PAID,
+            start_time=now,
+            end_time=ended_at,
+            payment_amount=PAID_AMOUNT,
+            payment_time=ended_at
+        ),
+    }
+
+async def test_process_payment_success(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_payment_data, session_states):
     """Testa o processamento bem-sucedido de um pagamento."""
-    # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = True
-    mock_http_port.validate_signature.return_value = True
-    mock_session = mock_session()
-    mock_session.start(datetime.utcnow())
-    mock_session.end(datetime.utcnow() + timedelta(hours=2))
-    mock_blockchain_port.get_session.return_value = mock_session
-    mock_blockchain_port.get_user.return_value = mock_user()
+    # Configurar mocks (validação, usuário e saldo usam os valores padrão dos fixtures)
+    mock_http_port.parse_decimal.return_value = PAYMENT_AMOUNT
+    mock_blockchain_port.get_session.side_effect = [session_states["ended"], session_states["paid"]]
     
     # Executar caso de uso
     result = await mock_payment_use_case.process_payment(
-        valid_payment_data["session_id"],
         valid_payment_data["wallet_address"],
-        valid_payment_data["signature"]
+        valid_payment_data["session_id"],
+        valid_payment_data["amount"]
     )
     
     # Verificar resultado
-    assert result["success"] is True
-    assert result["data"]["session_id"] == valid_payment_data["session_id"]
-    assert result["data"]["status"] == SessionStatus.PAID.value
-    assert "payment_amount" in result["data"]
-    assert "payment_time" in result["data"]
+    assert result["id"] == valid_payment_data["session_id"]
+    assert result["status"] == SessionStatus.PAID.value
+    assert result["payment_amount"] is not None
+    assert result["payment_time"] is not None
     
     # Verificar chamadas aos mocks
-    mock_http_port.validate_wallet_address.assert_called_once_with(valid_payment_data["wallet_address"])
-    mock_http_port.validate_signature.assert_called_once()
-    mock_blockchain_port.get_session.assert_called_once_with(valid_payment_data["session_id"])
-    mock_blockchain_port.get_user.assert_called_once_with(valid_payment_data["wallet_address"])
+    assert mock_http_port.mock_calls == [
+        _VALIDATE_WALLET,
+        _PARSE_AMOUNT,
+        call.format_session_response(session_states["paid"])
+    ]
+    assert mock_blockchain_port.mock_calls == [
+        _GET_USER,
+        _GET_SESSION,
+        call.get_eth_balance(valid_payment_data["wallet_address"]),
+        call.pay_session(session_id=valid_payment_data["session_id"], amount=PAYMENT_AMOUNT),
+        _GET_SESSION
+    ]
 
-@pytest.mark.asyncio
-async def test_get_payment_history_success(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_wallet_address):
+async def test_get_payment_history_success(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_wallet_address, session_states):
     """Testa a obtenção bem-sucedida do histórico de pagamentos."""
-    # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = True
-    mock_blockchain_port.get_user.return_value = mock_user()
+    # Configurar mocks (validação e usuário usam os valores padrão dos fixtures)
     mock_blockchain_port.get_session.side_effect = [
-        mock_session(),
-        mock_session()
+        session_states["created"],
+        session_states["created"]
     ]
     
     # Executar caso de uso
@@ -68,116 +117,9 @@ async def test_get_payment_history_success(mock_payment_use_case, mock_http_port
     mock_http_port.validate_wallet_address.assert_called_once_with(valid_wallet_address)
     mock_blockchain_port.get_user.assert_called_once_with(valid_wallet_address)
 
-@pytest.mark.asyncio
-async def test_process_payment_invalid_wallet(mock_payment_use_case, mock_http_port, valid_payment_data):
-    """Testa o processamento de pagamento com carteira inválida."""
-    # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = False
-    
-    # Executar caso de uso e verificar exceção
-    with pytest.raises(ValidationError):
-        await mock_payment_use_case.process_payment(
-            valid_payment_data["session_id"],
-            valid_payment_data["wallet_address"],
-            valid_payment_data["signature"]
-        )
-    
-    # Verificar chamadas aos mocks
-    mock_http_port.validate_wallet_address.assert_called_once_with(valid_payment_data["wallet_address"])
-
-@pytest.mark.asyncio
-async def test_process_payment_invalid_signature(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_payment_data):
-    """Testa o processamento de pagamento com assinatura inválida."""
-    # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = True
-    mock_http_port.validate_signature.return_value = False
-    
-    # Executar caso de uso e verificar exceção
-    with pytest.raises(ValidationError):
-        await mock_payment_use_case.process_payment(
-            valid_payment_data["session_id"],
-            valid_payment_data["wallet_address"],
-            valid_payment_data["signature"]
-        )
-    
-    # Verificar chamadas aos mocks
-    mock_http_port.validate_wallet_address.assert_called_once_with(valid_payment_data["wallet_address"])
-    mock_http_port.validate_signature.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_process_payment_session_not_found(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_payment_data):
-    """Testa o processamento de pagamento para sessão inexistente."""
-    # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = True
-    mock_http_port.validate_signature.return_value = True
-    mock_blockchain_port.get_session.side_effect = ResourceNotFoundError(valid_payment_data["session_id"])
-    
-    # Executar caso de uso e verificar exceção
-    with pytest.raises(ResourceNotFoundError):
-        await mock_payment_use_case.process_payment(
-            valid_payment_data["session_id"],
-            valid_payment_data["wallet_address"],
-            valid_payment_data["signature"]
-        )
-    
-    # Verificar chamadas aos mocks
-    mock_http_port.validate_wallet_address.assert_called_once_with(valid_payment_data["wallet_address"])
-    mock_http_port.validate_signature.assert_called_once()
-    mock_blockchain_port.get_session.assert_called_once_with(valid_payment_data["session_id"])
-
-@pytest.mark.asyncio
-async def test_process_payment_session_not_ended(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_payment_data):
-    """Testa o processamento de pagamento para sessão não finalizada."""
-    # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = True
-    mock_http_port.validate_signature.return_value = True
-    mock_session = mock_session()
-    mock_session.start(datetime.utcnow())  # Sessão ativa, não finalizada
-    mock_blockchain_port.get_session.return_value = mock_session
-    
-    # Executar caso de uso e verificar exceção
-    with pytest.raises(ValidationError):
-        await mock_payment_use_case.process_payment(
-            valid_payment_data["session_id"],
-            valid_payment_data["wallet_address"],
-            valid_payment_data["signature"]
-        )
-    
-    # Verificar chamadas aos mocks
-    mock_http_port.validate_wallet_address.assert_called_once_with(valid_payment_data["wallet_address"])
-    mock_http_port.validate_signature.assert_called_once()
-    mock_blockchain_port.get_session.assert_called_once_with(valid_payment_data["session_id"])
-
-@pytest.mark.asyncio
-async def test_process_payment_already_paid(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_payment_data):
-    """Testa o processamento de pagamento para sessão já paga."""
-    # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = True
-    mock_http_port.validate_signature.return_value = True
-    mock_session = mock_session()
-    mock_session.start(datetime.utcnow())
-    mock_session.end(datetime.utcnow() + timedelta(hours=2))
-    mock_session.pay(Decimal("50.00"), datetime.utcnow())  # Marcar como paga
-    mock_blockchain_port.get_session.return_value = mock_session
-    
-    # Executar caso de uso e verificar exceção
-    with pytest.raises(ResourceConflictError):
-        await mock_payment_use_case.process_payment(
-            valid_payment_data["session_id"],
-            valid_payment_data["wallet_address"],
-            valid_payment_data["signature"]
-        )
-    
-    # Verificar chamadas aos mocks
-    mock_http_port.validate_wallet_address.assert_called_once_with(valid_payment_data["wallet_address"])
-    mock_http_port.validate_signature.assert_called_once()
-    mock_blockchain_port.get_session.assert_called_once_with(valid_payment_data["session_id"])
-
-@pytest.mark.asyncio
 async def test_get_payment_history_user_not_found(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_wallet_address):
     """Testa a obtenção de histórico de pagamentos para usuário inexistente."""
     # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = True
     mock_blockchain_port.get_user.side_effect = ResourceNotFoundError(valid_wallet_address)
     
     # Executar caso de uso e verificar exceção
@@ -188,16 +130,68 @@ async def test_get_payment_history_user_not_found(mock_payment_use_case, mock_ht
     mock_http_port.validate_wallet_address.assert_called_once_with(valid_wallet_address)
     mock_blockchain_port.get_user.assert_called_once_with(valid_wallet_address)
 
-@pytest.mark.asyncio
-async def test_blockchain_error(mock_payment_use_case, mock_http_port, mock_blockchain_port, valid_payment_data):
-    """Testa o tratamento de erro da blockchain."""
+# Cenários de falha do processamento de pagamento: (configuração do HTTP,
+# configuração da blockchain, estado da sessão, exceção esperada, chamadas verificadas)
+PROCESS_PAYMENT_ERROR_CASES = [
+    pytest.param(
+        {"validate_wallet_address": False}, {}, None, ValidationError,
+        ("validate_wallet_address",),
+        id="invalid_wallet"
+    ),
+    pytest.param(
+        {"validate_signature": False}, {}, None, ValidationError,
+        ("validate_wallet_address", "validate_signature"),
+        id="invalid_signature"
+    ),
+    pytest.param(
+        {}, {"get_session": ResourceNotFoundError(1)}, None, ResourceNotFoundError,
+        ("validate_wallet_address", "validate_signature", "get_session"),
+        id="session_not_found"
+    ),
+    pytest.param(
+        {}, {}, "active", ValidationError,
+        ("validate_wallet_address", "validate_signature", "get_session"),
+        id="session_not_ended"
+    ),
+    pytest.param(
+        {}, {}, "paid", ResourceConflictError,
+        ("validate_wallet_address", "validate_signature", "get_session"),
+        id="already_paid"
+    ),
+    pytest.param(
+        {}, {"get_session": BlockchainError("Erro na blockchain")}, None, BlockchainError,
+        ("validate_wallet_address", "validate_signature", "get_session"),
+        id="blockchain_error"
+    ),
+]
+
+def _configure_mock(mock, config):
+    """Aplica ao mock o valor de retorno ou a exceção de cada método configurado."""
+    for name, value in config.items():
+        method = getattr(mock, name)
+        if isinstance(value, Exception):
+            method.side_effect = value
+        else:
+            method.return_value = value
+
+@pytest.mark.parametrize(
+    "http_config,blockchain_config,session_state,expected_exc,checked_calls",
+    PROCESS_PAYMENT_ERROR_CASES
+)
+async def test_process_payment_errors(
+    mock_payment_use_case, mock_http_port, mock_blockchain_port, session_states,
+    valid_payment_data, http_config, blockchain_config, session_state, expected_exc,
+    checked_calls
+):
+    """Testa as falhas do processamento de pagamento."""
     # Configurar mocks
-    mock_http_port.validate_wallet_address.return_value = True
-    mock_http_port.validate_signature.return_value = True
-    mock_blockchain_port.get_session.side_effect = BlockchainError("Erro na blockchain")
+    _configure_mock(mock_http_port, http_config)
+    _configure_mock(mock_blockchain_port, blockchain_config)
+    if session_state:
+        mock_blockchain_port.get_session.return_value = session_states[session_state]
     
     # Executar caso de uso e verificar exceção
-    with pytest.raises(BlockchainError):
+    with pytest.raises(expected_exc):
         await mock_payment_use_case.process_payment(
             valid_payment_data["session_id"],
             valid_payment_data["wallet_address"],
@@ -206,5 +200,7 @@ async def test_blockchain_error(mock_payment_use_case, mock_http_port, mock_bloc
     
     # Verificar chamadas aos mocks
     mock_http_port.validate_wallet_address.assert_called_once_with(valid_payment_data["wallet_address"])
-    mock_http_port.validate_signature.assert_called_once()
-    mock_blockchain_port.get_session.assert_called_once_with(valid_payment_data["session_id"]) 
\ No newline at end of file
+    if "validate_signature" in checked_calls:
+        mock_http_port.validate_signature.assert_called_once()
+    if "get_session" in checked_calls:
+        mock_blockchain_port.get_session.assert_called_once_with(valid_payment_data["session_id"])